@@ -4,7 +4,7 @@ User API endpoints for CRUD operations.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -100,6 +100,45 @@ async def find_or_create_user_by_name(
         )
 
 
+@user_router.post(
+    "/by-name:batch",
+    response_model=List[UserResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def find_or_create_users_by_name(
+    users_data: List[UserByNameCreate] = Body(..., min_length=1, max_length=100),
+    db: Session = Depends(get_db),
+) -> List[UserResponse]:
+    """
+    Find or create several users by name in one request and one transaction.
+
+    Each entry is handled exactly like POST /users/by-name; if any entry
+    fails, none of the changes are saved.
+
+    Args:
+        users_data: List of user data, each with a full name and optional settings
+        db: Database session
+
+    Returns:
+        User information (existing or newly created) in request order
+
+    Raises:
+        409: Unable to create one of the users
+        422: Validation error
+    """
+    try:
+        users = UserService.find_or_create_users_by_name(
+            db, [user_data.model_dump() for user_data in users_data]
+        )
+        return [UserResponse.model_validate(user) for user in users]
+    except ConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+
 @user_router.get("/", response_model=List[UserSummary])
 async def get_users(
     skip: int = Query(0, ge=0, description="Number of users to skip"),
@@ -116,6 +116,15 @@ class Settings(BaseSettings):
         default="/openapi.json", description="OpenAPI JSON URL (None to disable)"
     )
 
+    # Response cache settings
+    response_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Lifetime of cached total weeks GET responses (0 to disable)",
+    )
+    response_cache_max_size: int = Field(
+        default=1024, description="Maximum number of cached total weeks responses"
+    )
+
 
 # Global settings instance
 settings = Settings()
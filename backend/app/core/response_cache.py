@@ -0,0 +1,132 @@
+"""
+Response caching middleware for idempotent GET endpoints.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# (path, raw query string)
+CacheKey = Tuple[str, bytes]
+
+# (status code, raw headers, body)
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ResponseCache:
+    """
+    Simple in-memory TTL cache for response bodies with LRU eviction.
+    In production, use Redis or another distributed cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Store for each key: (expiry timestamp, cached response)
+        self.entries: "OrderedDict[CacheKey, Tuple[float, CachedResponse]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """
+        Get a cached response if it has not expired.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            self.entries.pop(key, None)
+            return None
+
+        self.entries.move_to_end(key)
+        return response
+
+    def set(self, key: CacheKey, response: CachedResponse) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self.entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.entries.clear()
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware that caches successful GET responses for selected paths.
+
+    Responses carry an ``X-Cache: HIT`` or ``X-Cache: MISS`` header. Only
+    200 responses are stored, keyed by path and query string. Nothing else
+    invalidates an entry before its TTL expires, so only register paths whose
+    result depends on the request alone and not on the current date or time.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str] = (),
+        path_prefixes: Iterable[str] = (),
+        max_size: int = 1024,
+        ttl_seconds: float = 60,
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.path_prefixes = tuple(path_prefixes)
+        self.cache = ResponseCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not (
+                scope["path"] in self.paths
+                or scope["path"].startswith(self.path_prefixes)
+            )
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["path"], scope["query_string"])
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached_status, cached_headers, cached_body = cached
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": cached_status,
+                    "headers": [*cached_headers, (b"x-cache", b"HIT")],
+                }
+            )
+            await send({"type": "http.response.body", "body": cached_body})
+            return
+
+        status_code: Optional[int] = None
+        headers: List[Tuple[bytes, bytes]] = []
+        body_parts: List[bytes] = []
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                message = {**message, "headers": [*headers, (b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and status_code == 200:
+                body_parts.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self.cache.set(key, (status_code, headers, b"".join(body_parts)))
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
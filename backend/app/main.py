@@ -7,11 +7,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.exceptions import add_exception_handlers
 from app.core.logging import setup_logging
+from app.core.response_cache import ResponseCacheMiddleware
 
 
 @asynccontextmanager
@@ -63,6 +65,8 @@ def create_app() -> FastAPI:
         redoc_url=settings.redoc_url,
         openapi_url=settings.openapi_url,
         lifespan=lifespan,
+        # Serialize responses with orjson, notably the nested week payloads
+        default_response_class=ORJSONResponse,
     )
 
     # Add middleware
@@ -112,6 +116,20 @@ def setup_middleware(app: FastAPI) -> None:
         app: FastAPI application instance
     """
 
+    # Cache idempotent week calculation GETs; added first so it runs inside
+    # CORS and responses still get per-origin headers
+    if settings.response_cache_ttl_seconds > 0:
+        weeks_prefix = f"{settings.api_v1_prefix}/weeks/"
+        # Only the total weeks endpoints are cached: the current week and life
+        # progress depend on today's date in the requested timezone
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            paths=[f"{weeks_prefix}total"],
+            path_prefixes=[f"{weeks_prefix}total-weeks/"],
+            max_size=settings.response_cache_max_size,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        )
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
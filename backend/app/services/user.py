@@ -3,6 +3,8 @@ User service layer for business logic and CRUD operations.
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Optional
 
@@ -33,10 +35,17 @@ pwd_context = CryptContext(
     argon2__rounds=4,
 )
 
+# Maximum number of full name -> user ID entries kept by UserService
+NAME_CACHE_MAX_SIZE = 1024
+
 
 class UserService:
     """Service class for user-related business logic and database operations."""
 
+    # Recently resolved full names -> user IDs, least recently used first
+    _name_cache: "OrderedDict[str, int]" = OrderedDict()
+    _name_cache_lock = threading.Lock()
+
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a plain text password."""
@@ -180,13 +189,17 @@ class UserService:
         return query.first()
 
     @staticmethod
-    def find_or_create_user_by_name(db: Session, full_name: str, **kwargs) -> User:
+    def find_or_create_user_by_name(
+        db: Session, full_name: str, commit: bool = True, **kwargs
+    ) -> User:
         """
         Find existing user by full name and update with new data, or create a new one with default settings.
 
         Args:
             db: Database session
             full_name: User's full name
+            commit: Commit the changes, or only flush them so the caller can
+                commit several calls as one transaction
             **kwargs: Additional user data (date_of_birth, lifespan, theme, font_size)
 
         Returns:
@@ -198,8 +211,12 @@ class UserService:
 
         repo = UserRepository(db)
 
-        # Try to find existing user by full name
-        existing_user = repo.get_by_full_name(full_name, include_deleted=False)
+        # Try to find existing user by full name, by primary key when cached
+        existing_user = UserService._get_cached_user_by_name(db, full_name)
+        if existing_user is None:
+            existing_user = repo.get_by_full_name(full_name, include_deleted=False)
+            if existing_user:
+                UserService._cache_user_name(full_name, existing_user.id)
         logger.info(f"FIND_OR_CREATE: Looking for user with name: {full_name}")
         if existing_user:
             logger.info(
@@ -272,7 +289,10 @@ class UserService:
             if update_made:
                 existing_user.updated_at = current_time
                 try:
-                    db.commit()
+                    if commit:
+                        db.commit()
+                    else:
+                        db.flush()
                     db.refresh(existing_user)
                     logger.info(
                         f"Successfully updated existing user: {full_name} (ID: {existing_user.id})"
@@ -329,8 +349,12 @@ class UserService:
             )
 
             db.add(db_user)
-            db.commit()
+            if commit:
+                db.commit()
+            else:
+                db.flush()
             db.refresh(db_user)
+            UserService._cache_user_name(full_name, db_user.id)
 
             logger.info(
                 f"Created new name-based user: {full_name} -> {username} (ID: {db_user.id})"
@@ -348,6 +372,82 @@ class UserService:
             logger.error(f"Error creating name-based user: {e}")
             raise
 
+    @staticmethod
+    def find_or_create_users_by_name(db: Session, users_data: List[dict]) -> List[User]:
+        """
+        Find or create several users by full name in a single transaction.
+
+        Args:
+            db: Database session
+            users_data: One dict per user with full_name and the optional
+                settings accepted by find_or_create_user_by_name
+
+        Returns:
+            User instances in the same order as users_data
+
+        Raises:
+            ConflictError: If any user cannot be created; nothing is saved
+        """
+        try:
+            users = [
+                UserService.find_or_create_user_by_name(db, commit=False, **user_data)
+                for user_data in users_data
+            ]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        logger.info(f"Found or created {len(users)} name-based users in one batch")
+        return users
+
+    @staticmethod
+    def _get_cached_user_by_name(db: Session, full_name: str) -> Optional[User]:
+        """
+        Get a non-deleted user through the full name cache.
+
+        Args:
+            db: Database session
+            full_name: Full name to look up
+
+        Returns:
+            User instance, or None if the name is not cached or the cached
+            entry no longer matches the database
+        """
+        with UserService._name_cache_lock:
+            user_id = UserService._name_cache.get(full_name)
+        if user_id is None:
+            return None
+
+        user = db.get(User, user_id)
+
+        # The user may have been renamed or deleted outside this service
+        if user is None or user.is_deleted or user.full_name != full_name:
+            UserService._forget_user_name(full_name)
+            return None
+
+        with UserService._name_cache_lock:
+            if full_name in UserService._name_cache:
+                UserService._name_cache.move_to_end(full_name)
+        return user
+
+    @staticmethod
+    def _cache_user_name(full_name: str, user_id: int) -> None:
+        """Remember the user ID for a full name, evicting the oldest entry."""
+        with UserService._name_cache_lock:
+            UserService._name_cache[full_name] = user_id
+            UserService._name_cache.move_to_end(full_name)
+            if len(UserService._name_cache) > NAME_CACHE_MAX_SIZE:
+                UserService._name_cache.popitem(last=False)
+
+    @staticmethod
+    def _forget_user_name(full_name: Optional[str]) -> None:
+        """Drop a full name from the cache after a rename or delete."""
+        if full_name is None:
+            return
+        with UserService._name_cache_lock:
+            UserService._name_cache.pop(full_name, None)
+
     @staticmethod
     def get_user_by_email(
         db: Session, email: str, include_deleted: bool = False
@@ -475,6 +575,7 @@ class UserService:
                     raise ConflictError(f"Email '{user_data.email}' already exists")
 
             # Update user fields
+            previous_full_name = user.full_name
             update_data = user_data.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(user, field, value)
@@ -482,6 +583,9 @@ class UserService:
             db.commit()
             db.refresh(user)
 
+            if user.full_name != previous_full_name:
+                UserService._forget_user_name(previous_full_name)
+
             logger.info(f"Updated user: {user.username} ({user.id})")
             return user
 
@@ -612,6 +716,7 @@ class UserService:
 
             db.commit()
             db.refresh(user)
+            UserService._forget_user_name(user.full_name)
 
             logger.info(f"Soft deleted user: {user.username} ({user.id})")
             return user
@@ -650,6 +755,7 @@ class UserService:
 
             db.commit()
             db.refresh(user)
+            UserService._forget_user_name(user.full_name)
 
             logger.info(f"Restored user: {user.username} ({user.id})")
             return user
@@ -681,8 +787,10 @@ class UserService:
 
         try:
             username = user.username
+            full_name = user.full_name
             db.delete(user)
             db.commit()
+            UserService._forget_user_name(full_name)
 
             logger.warning(f"Hard deleted user: {username} ({user_id})")
             return True
@@ -5,14 +5,29 @@ Provides core date arithmetic functions for week calculations with proper
 timezone handling, leap year support, and DST transition handling.
 """
 
-import calendar
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
 import zoneinfo
 from dateutil.relativedelta import relativedelta
 
+# Packed (month, day) keys, see WeekCalculationService._pack_month_day
+JANUARY_1ST_MONTH_DAY = 1 * 32 + 1
+LEAP_DAY_MONTH_DAY = 2 * 32 + 29
+
+# Timezones resolved so far, keyed by the name they were requested with
+_TZ_CACHE: Dict[str, zoneinfo.ZoneInfo] = {}
+
+
+def _tz(name: str) -> zoneinfo.ZoneInfo:
+    """Return the ZoneInfo for a timezone name, loading it only once."""
+    tz_info = _TZ_CACHE.get(name)
+    if tz_info is None:
+        tz_info = _TZ_CACHE[name] = zoneinfo.ZoneInfo(name)
+    return tz_info
+
 
 class WeekType(Enum):
     """Enumeration of special week types."""
@@ -89,7 +104,7 @@ class WeekCalculationService:
             InvalidTimezoneError: If the timezone is invalid
         """
         try:
-            return zoneinfo.ZoneInfo(timezone)
+            return _tz(timezone)
         except zoneinfo.ZoneInfoNotFoundError:
             raise InvalidTimezoneError(f"Invalid timezone: {timezone}")
         except Exception as e:
@@ -171,6 +186,11 @@ class WeekCalculationService:
         """
         WeekCalculationService.validate_date_of_birth(dob)
 
+        # A DOB of today is always week 0 (UTC offsets are far below 7 days),
+        # so skip the timezone-aware clock lookup on first-login requests
+        if timezone.upper() == "UTC" and dob == date.today():
+            return 0
+
         # Get current date in the specified timezone
         now = WeekCalculationService.get_timezone_aware_datetime(timezone)
         current_date = now.date()
@@ -187,6 +207,37 @@ class WeekCalculationService:
 
         return week_index
 
+    @staticmethod
+    def calculate_current_week_indices(
+        dob: date, timezones: Sequence[str]
+    ) -> List[int]:
+        """
+        Calculate the current week index since birth for several timezones.
+
+        Args:
+            dob: Date of birth
+            timezones: Timezone strings for current time calculation
+
+        Returns:
+            Current week index (0-based) for each timezone, in the given order
+
+        Raises:
+            InvalidDateError: If date of birth is invalid
+            FutureDateError: If date of birth is in the future
+            InvalidTimezoneError: If any timezone is invalid
+        """
+        WeekCalculationService.validate_date_of_birth(dob)
+
+        # Validate and convert the DOB once, only the current date varies
+        dob_ordinal = dob.toordinal()
+        week_indices = []
+        for timezone in timezones:
+            now = WeekCalculationService.get_timezone_aware_datetime(timezone)
+            days_since_birth = now.date().toordinal() - dob_ordinal
+            week_indices.append(max(0, days_since_birth) // 7)
+
+        return week_indices
+
     @staticmethod
     def get_week_start_date(dob: date, week_index: int) -> date:
         """
@@ -222,12 +273,16 @@ class WeekCalculationService:
         return start_date + timedelta(days=6)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def detect_special_week_type(
         dob: date, week_index: int, timezone: str = "UTC"
     ) -> WeekType:
         """
         Detect if a specific week is a special week type.
 
+        Results are cached: the week type only depends on the arguments, and
+        a DOB that passes validation stays valid as time moves forward.
+
         Args:
             dob: Date of birth
             week_index: Week index to check
@@ -245,21 +300,74 @@ class WeekCalculationService:
             tz_info = WeekCalculationService.validate_timezone(timezone)
 
         week_start = WeekCalculationService.get_week_start_date(dob, week_index)
-        week_end = WeekCalculationService.get_week_end_date(dob, week_index)
+        return WeekCalculationService._classify_week(
+            WeekCalculationService._pack_month_day(dob), week_start, tz_info
+        )
+
+    @staticmethod
+    def detect_special_week_types(
+        dob: date, week_indices: Sequence[int], timezone: str = "UTC"
+    ) -> List[WeekType]:
+        """
+        Detect the special week type of several weeks since birth.
+
+        Args:
+            dob: Date of birth
+            week_indices: Week indices to check
+            timezone: Timezone for DST transition detection
+
+        Returns:
+            WeekType for each week index, in the given order
+
+        Raises:
+            InvalidDateError: If date of birth is invalid
+            FutureDateError: If date of birth is in the future
+            InvalidTimezoneError: If timezone is invalid
+            ValueError: If any week index is negative
+        """
+        WeekCalculationService.validate_date_of_birth(dob)
+
+        # Validate the inputs once, only the week start varies per index
+        if timezone.upper() == "UTC":
+            tz_info = None  # UTC has no DST
+        else:
+            tz_info = WeekCalculationService.validate_timezone(timezone)
+
+        if any(week_index < 0 for week_index in week_indices):
+            raise ValueError("Week index must be non-negative")
+
+        dob_month_day = WeekCalculationService._pack_month_day(dob)
+        return [
+            WeekCalculationService._classify_week(
+                dob_month_day, dob + timedelta(weeks=week_index), tz_info
+            )
+            for week_index in week_indices
+        ]
+
+    @staticmethod
+    def _classify_week(
+        dob_month_day: int, week_start: date, tz_info: Optional[zoneinfo.ZoneInfo]
+    ) -> WeekType:
+        """Classify the week starting at week_start (see detect_special_week_type)."""
+        # Compare packed (month, day) ints instead of building dates per year.
+        # Feb 29 only appears in leap years, so a leap-day birthday is skipped
+        # in non-leap years without any special casing.
+        month_days = WeekCalculationService._week_month_days(week_start)
 
         # Check if it's a birthday week
-        if WeekCalculationService._is_birthday_week(dob, week_start, week_end):
+        if dob_month_day in month_days:
             return WeekType.BIRTHDAY
 
         # Check if it's a year-start week
-        if WeekCalculationService._is_year_start_week(week_start, week_end):
+        if JANUARY_1ST_MONTH_DAY in month_days:
             return WeekType.YEAR_START
 
         # Check if it's a leap day week
-        if WeekCalculationService._is_leap_day_week(week_start, week_end):
+        if LEAP_DAY_MONTH_DAY in month_days:
             return WeekType.LEAP_DAY
 
         # Check if it's a DST transition week
+        week_end = week_start + timedelta(days=6)
         if WeekCalculationService._is_dst_transition_week(
             week_start, week_end, tz_info
         ):
@@ -268,62 +376,22 @@ class WeekCalculationService:
         return WeekType.NORMAL
 
     @staticmethod
-    def _is_birthday_week(dob: date, week_start: date, week_end: date) -> bool:
-        """Check if the week contains a birthday anniversary."""
-        # Check if birthday anniversary falls within this week
-        # First, check the year of the week start
-        try:
-            anniversary = date(week_start.year, dob.month, dob.day)
-            if week_start <= anniversary <= week_end:
-                return True
-        except ValueError:
-            # Handle leap year edge case (Feb 29 on non-leap year)
-            pass
-
-        # If week spans across years, also check the end year
-        if week_start.year != week_end.year:
-            try:
-                anniversary = date(week_end.year, dob.month, dob.day)
-                if week_start <= anniversary <= week_end:
-                    return True
-            except ValueError:
-                # Handle leap year edge case (Feb 29 on non-leap year)
-                pass
-
-        return False
-
-    @staticmethod
-    def _is_year_start_week(week_start: date, week_end: date) -> bool:
-        """Check if the week contains January 1st."""
-        # Check if January 1st of the week_start year falls within this week
-        jan_1 = date(week_start.year, 1, 1)
-        if week_start <= jan_1 <= week_end:
-            return True
-
-        # If week spans across years, check January 1st of the end year
-        if week_start.year != week_end.year:
-            jan_1_end_year = date(week_end.year, 1, 1)
-            if week_start <= jan_1_end_year <= week_end:
-                return True
-
-        return False
+    def _pack_month_day(day: date) -> int:
+        """Pack a date's (month, day) pair into a single int (month * 32 + day)."""
+        return day.month * 32 + day.day
 
     @staticmethod
-    def _is_leap_day_week(week_start: date, week_end: date) -> bool:
-        """Check if the week contains February 29th in a leap year."""
-        year = week_start.year
-        if calendar.isleap(year):
-            leap_day = date(year, 2, 29)
-            return week_start <= leap_day <= week_end
-        # Check if week spans across leap year boundary
-        if week_start.year != week_end.year and calendar.isleap(week_end.year):
-            leap_day = date(week_end.year, 2, 29)
-            return leap_day <= week_end
-        return False
+    def _week_month_days(week_start: date) -> List[int]:
+        """Return the packed (month, day) keys for the 7 days of a week."""
+        start_ordinal = week_start.toordinal()
+        return [
+            WeekCalculationService._pack_month_day(date.fromordinal(ordinal))
+            for ordinal in range(start_ordinal, start_ordinal + 7)
+        ]
 
     @staticmethod
     def _is_dst_transition_week(
-        week_start: date, week_end: date, tz_info: zoneinfo.ZoneInfo
+        week_start: date, week_end: date, tz_info: Optional[zoneinfo.ZoneInfo]
     ) -> bool:
         """Check if the week contains a DST transition."""
         if tz_info is None or (hasattr(tz_info, "key") and tz_info.key == "UTC"):
@@ -4,8 +4,12 @@ Test configuration and fixtures.
 
 import os
 import sys
+import zoneinfo
+from datetime import date, timedelta
 from unittest.mock import patch
 
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -19,19 +23,65 @@ from app.core.database import get_db
 from app.main import create_app
 from app.models.base import Base
 
+# Timezones exercised by the timezone-parametrized tests
+TEST_TIMEZONES = (
+    "UTC",
+    "America/New_York",
+    "Europe/London",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+    "America/Los_Angeles",
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def test_settings():
     """Create test settings with overrides."""
-    return Settings(
+    # Give each pytest-xdist worker its own database file, since every test
+    # creates and drops the tables. Read the worker from the environment
+    # rather than xdist's worker_id fixture so the suite also runs without
+    # the plugin (e.g. with -p no:xdist)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_name = "test.db" if worker == "master" else f"test_{worker}.db"
+    yield Settings(
         app_name="LifeTime AI Test",
         debug=True,
-        database_url="sqlite:///./test.db",
+        database_url=f"sqlite:///./{db_name}",
         secret_key="test-secret-key",
         cors_origins=["http://localhost:3000"],
         log_level="DEBUG",
     )
 
+    # Per-worker databases are not reused between runs, so remove them
+    if worker != "master" and os.path.exists(db_name):
+        os.remove(db_name)
+
+
+@pytest.fixture(scope="session")
+def today():
+    """
+    Today's date, read once for the whole test session.
+
+    The services still call the live date.today(), so only use this where a
+    session that crosses midnight cannot change the outcome (e.g. dates a year
+    out); tests comparing against the service's clock should read it directly.
+    """
+    return date.today()
+
+
+@pytest.fixture(scope="session")
+def future_date(today):
+    """ISO formatted date of birth one year in the future."""
+    return (today + timedelta(days=365)).isoformat()
+
+
+@pytest.fixture(scope="session")
+def tz_cache():
+    """Load the test timezones once so tzdata is parsed a single time per run."""
+    # ZoneInfo keeps loaded zones in its own cache, so later lookups by key
+    # (including the ones made by the service) return these same instances
+    return {key: zoneinfo.ZoneInfo(key) for key in TEST_TIMEZONES}
+
 
 @pytest.fixture
 def test_engine(test_settings):
@@ -86,6 +136,18 @@ def client(app):
     return TestClient(app)
 
 
+@pytest.fixture(scope="session")
+def stateless_client(test_settings):
+    """Create one test client for endpoints that never touch the test database.
+
+    The app is built once per session (once per pytest-xdist worker) instead
+    of once per test, together with its per-test engine and schema.
+    """
+    with patch("app.core.config.settings", test_settings):
+        app = create_app()
+    return TestClient(app)
+
+
 @pytest.fixture
 def test_user(test_session):
     """Create a test user."""
@@ -106,6 +168,28 @@ def test_user(test_session):
     return user
 
 
+_stdlib_response_json = httpx.Response.json
+
+
+def _orjson_response_json(self, **kwargs):
+    """Parse a response body with orjson, or the stdlib for decoder options."""
+    if kwargs:
+        # orjson takes no decoder options such as parse_float, so honour them
+        # with httpx's own stdlib-based implementation
+        return _stdlib_response_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def orjson_response_parsing():
+    """Parse test client JSON responses with orjson instead of the stdlib."""
+    # Module scope undoes the patch after each backend test module, so the
+    # httpx clients of the top-level HTTP scripts run in the same session
+    # keep the real Response.json
+    with patch.object(httpx.Response, "json", _orjson_response_json):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def setup_test_env():
     """Set up test environment variables."""
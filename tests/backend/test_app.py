@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 from app.main import create_app
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 
 class TestAppInitialization:
@@ -26,6 +27,13 @@ class TestAppInitialization:
             assert app.version == test_settings.app_version
             assert app.debug == test_settings.debug
 
+    def test_app_uses_orjson_responses(self, test_settings):
+        """Test that responses default to orjson serialization."""
+        with patch("app.core.config.settings", test_settings):
+            app = create_app()
+
+            assert app.router.default_response_class is ORJSONResponse
+
     def test_app_has_required_endpoints(self, client):
         """Test that app has required endpoints."""
         # Test root endpoint
@@ -4,10 +4,17 @@ Tests for CORS configuration and middleware.
 
 from unittest.mock import patch
 
+import pytest
 from app.core.config import Settings
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(scope="module")
+def client(stateless_client):
+    """Use the shared client, the CORS checks never touch the database."""
+    return stateless_client
+
+
 class TestCORSConfiguration:
     """Test CORS middleware configuration and behavior."""
 
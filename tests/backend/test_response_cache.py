@@ -0,0 +1,134 @@
+"""
+Tests for the response cache middleware on the week calculation endpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app.core.response_cache import ResponseCache
+from app.main import create_app
+from fastapi.testclient import TestClient
+
+TOTAL_WEEKS_URL = "/api/v1/weeks/total?date_of_birth=1990-01-15&lifespan_years=80"
+
+
+class TestResponseCache:
+    """Test the in-memory response cache."""
+
+    def test_get_returns_stored_response(self):
+        """Test a stored response is returned for its key."""
+        cache = ResponseCache()
+        key = ("/path", b"a=1")
+        response = (200, [(b"content-type", b"application/json")], b"{}")
+
+        assert cache.get(key) is None
+        cache.set(key, response)
+        assert cache.get(key) == response
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries are not returned once their TTL has passed."""
+        cache = ResponseCache(ttl_seconds=0)
+        key = ("/path", b"")
+
+        cache.set(key, (200, [], b"{}"))
+
+        assert cache.get(key) is None
+        assert key not in cache.entries
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the least recently used entry is evicted when the cache is full."""
+        cache = ResponseCache(max_size=2)
+        first, second, third = (("/path", str(i).encode()) for i in range(3))
+
+        cache.set(first, (200, [], b"1"))
+        cache.set(second, (200, [], b"2"))
+        cache.get(first)  # Make the second entry the least recently used
+        cache.set(third, (200, [], b"3"))
+
+        assert cache.get(second) is None
+        assert cache.get(first) == (200, [], b"1")
+        assert cache.get(third) == (200, [], b"3")
+
+
+class TestResponseCacheMiddleware:
+    """Test response caching on the total weeks endpoints."""
+
+    def test_repeated_get_is_served_from_cache(self, client):
+        """Test the second identical GET is a cache hit with the same body."""
+        first = client.get(TOTAL_WEEKS_URL)
+        second = client.get(TOTAL_WEEKS_URL)
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["content-type"] == first.headers["content-type"]
+
+    def test_query_string_is_part_of_the_key(self, client):
+        """Test requests with different parameters are cached separately."""
+        client.get(TOTAL_WEEKS_URL)
+        response = client.get(
+            "/api/v1/weeks/total?date_of_birth=1990-01-15&lifespan_years=90"
+        )
+
+        assert response.headers["x-cache"] == "MISS"
+        assert response.json()["lifespan_years"] == 90
+
+    def test_error_responses_are_not_cached(self, client):
+        """Test failed requests are recomputed every time."""
+        url = "/api/v1/weeks/total?date_of_birth=not-a-date"
+        client.get(url)
+        response = client.get(url)
+
+        assert response.status_code == 422
+        assert response.headers["x-cache"] == "MISS"
+
+    @pytest.mark.parametrize(
+        "method,url",
+        [
+            ("GET", "/api/v1/weeks/health"),
+            ("GET", "/api/v1/weeks/current?date_of_birth=1990-01-15"),
+            ("GET", "/api/v1/weeks/current-week/1990-01-15"),
+            ("GET", "/api/v1/weeks/life-progress?date_of_birth=1990-01-15"),
+            ("GET", "/health"),
+            ("POST", "/api/v1/weeks/total-weeks"),
+        ],
+    )
+    def test_uncached_routes(self, client, method, url):
+        """Test date-dependent routes, health checks and POSTs bypass the cache."""
+        json = {"date_of_birth": "1990-01-15"} if method == "POST" else None
+        response = client.request(method, url, json=json)
+
+        assert "x-cache" not in response.headers
+
+    def test_total_weeks_path_route_is_cached(self, client):
+        """Test the path-parameter total weeks route is cached too."""
+        url = "/api/v1/weeks/total-weeks/1990-01-15/80"
+        client.get(url)
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.headers["x-cache"] == "HIT"
+
+    def test_cached_response_gets_cors_headers(self, client):
+        """Test cache hits still carry the CORS headers for the request origin."""
+        client.get(TOTAL_WEEKS_URL)
+        response = client.get(
+            TOTAL_WEEKS_URL, headers={"Origin": "http://localhost:3000"}
+        )
+
+        assert response.headers["x-cache"] == "HIT"
+        assert "access-control-allow-origin" in response.headers
+
+    def test_cache_can_be_disabled(self, test_settings):
+        """Test a zero TTL disables the middleware."""
+        settings = test_settings.model_copy(update={"response_cache_ttl_seconds": 0})
+        with patch("app.main.settings", settings):
+            app = create_app()
+
+        client = TestClient(app)
+        client.get(TOTAL_WEEKS_URL)
+        response = client.get(TOTAL_WEEKS_URL)
+
+        assert response.status_code == 200
+        assert "x-cache" not in response.headers
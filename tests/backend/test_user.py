@@ -3,6 +3,7 @@ Tests for User model, service, and API endpoints.
 """
 
 from datetime import date, datetime
+from unittest.mock import patch
 
 import pytest
 from app.core.exceptions import ConflictError, NotFoundError, ValidationError
@@ -458,6 +459,72 @@ class TestUserService:
         user = UserService.get_user(test_session, created_user.id)
         assert user is not None
 
+    def test_find_or_create_user_by_name_caches_user_id(self, test_session):
+        """Test returning name-based users are resolved through the name cache."""
+        user = UserService.find_or_create_user_by_name(test_session, "Cached Person")
+        assert UserService._name_cache["Cached Person"] == user.id
+
+        user2 = UserService.find_or_create_user_by_name(test_session, "Cached Person")
+        assert user2.id == user.id
+
+    def test_find_or_create_user_by_name_after_rename(self, test_session):
+        """Test renaming a user drops its old name from the name cache."""
+        user = UserService.find_or_create_user_by_name(test_session, "Old Name")
+
+        UserService.update_user(test_session, user.id, UserUpdate(full_name="New Name"))
+        assert "Old Name" not in UserService._name_cache
+
+        new_user = UserService.find_or_create_user_by_name(test_session, "Old Name")
+        assert new_user.id != user.id
+        assert new_user.full_name == "Old Name"
+
+    def test_find_or_create_user_by_name_stale_cache_entry(self, test_session):
+        """Test cache entries that no longer match the database are ignored."""
+        user = UserService.find_or_create_user_by_name(test_session, "Stale Person")
+
+        # Rename outside the service, leaving the cache entry behind
+        user.full_name = "Someone Else"
+        test_session.commit()
+        assert UserService._name_cache["Stale Person"] == user.id
+
+        new_user = UserService.find_or_create_user_by_name(test_session, "Stale Person")
+        assert new_user.id != user.id
+        assert new_user.full_name == "Stale Person"
+        assert UserService._name_cache["Stale Person"] == new_user.id
+
+    def test_find_or_create_users_by_name_rolls_back_on_failure(self, test_session):
+        """Test a failing entry rolls back the entries flushed before it."""
+        existing = UserService.find_or_create_user_by_name(
+            test_session, "Batch Existing", theme="light"
+        )
+        find_or_create = UserService.find_or_create_user_by_name
+
+        def fail_on_conflict_entry(db, full_name, **kwargs):
+            if full_name == "Batch Conflict":
+                # The earlier entries have been flushed but not committed
+                assert db.query(User).filter_by(full_name="Batch New").count() == 1
+                raise ConflictError("Username already exists")
+            return find_or_create(db, full_name, **kwargs)
+
+        with patch.object(
+            UserService,
+            "find_or_create_user_by_name",
+            side_effect=fail_on_conflict_entry,
+        ):
+            with pytest.raises(ConflictError):
+                UserService.find_or_create_users_by_name(
+                    test_session,
+                    [
+                        {"full_name": "Batch New"},
+                        {"full_name": "Batch Existing", "theme": "dark"},
+                        {"full_name": "Batch Conflict"},
+                    ],
+                )
+
+        # Neither the new user nor the update to the existing user was saved
+        assert test_session.query(User).filter_by(full_name="Batch New").count() == 0
+        assert test_session.get(User, existing.id).theme == "light"
+
     def test_change_password_success(self, test_session):
         """Test successful password change."""
         user_data = UserCreate(
@@ -584,6 +651,79 @@ class TestUserAPI:
         assert "id" in response_data
         assert "hashed_password" not in response_data  # Should not be exposed
 
+    def test_find_or_create_user_by_name_updates_existing_user(self, client):
+        """Test posting an existing name updates that user's profile fields."""
+        initial_data = {
+            "full_name": "Test Update User",
+            "date_of_birth": "1990-01-01",
+            "lifespan": 80,
+            "theme": "light",
+            "font_size": 14,
+        }
+        updated_data = {
+            "full_name": "Test Update User",
+            "date_of_birth": "1995-06-15",
+            "lifespan": 85,
+            "theme": "dark",
+            "font_size": 16,
+        }
+
+        response1 = client.post("/api/v1/users/by-name", json=initial_data)
+        response2 = client.post("/api/v1/users/by-name", json=updated_data)
+
+        assert response1.status_code == response2.status_code == 201
+        user1, user2 = response1.json(), response2.json()
+        assert user2["id"] == user1["id"]
+        for key, value in updated_data.items():
+            assert user2[key] == value, key
+
+    def test_find_or_create_users_by_name_batch_endpoint(self, client):
+        """Test finding or creating several users by name in one request."""
+        existing = client.post(
+            "/api/v1/users/by-name", json={"full_name": "Batch Existing"}
+        ).json()
+
+        response = client.post(
+            "/api/v1/users/by-name:batch",
+            json=[
+                {"full_name": "Batch New", "date_of_birth": "1985-12-01"},
+                {"full_name": "Batch Existing", "theme": "dark"},
+                {"full_name": "Batch New"},
+            ],
+        )
+        assert response.status_code == 201
+
+        users = response.json()
+        assert [user["full_name"] for user in users] == [
+            "Batch New",
+            "Batch Existing",
+            "Batch New",
+        ]
+        assert users[0]["date_of_birth"] == "1985-12-01"
+        assert users[1]["id"] == existing["id"]
+        assert users[1]["theme"] == "dark"
+        assert users[2]["id"] == users[0]["id"]
+
+        # The batch results are persisted and visible to later requests
+        response = client.get("/api/v1/users/by-name/Batch%20New")
+        assert response.status_code == 200
+        assert response.json()["id"] == users[0]["id"]
+
+    def test_find_or_create_users_by_name_batch_validation(self, client):
+        """Test the batch endpoint rejects empty and invalid batches."""
+        response = client.post("/api/v1/users/by-name:batch", json=[])
+        assert response.status_code == 422
+
+        response = client.post(
+            "/api/v1/users/by-name:batch",
+            json=[{"full_name": "Valid Name"}, {"full_name": ""}],
+        )
+        assert response.status_code == 422
+
+        # Nothing from the rejected batch is saved
+        response = client.get("/api/v1/users/by-name/Valid%20Name")
+        assert response.status_code == 404
+
     def test_create_user_duplicate_username(self, client):
         """Test creating user with duplicate username via API."""
         user_data = {
@@ -10,39 +10,98 @@ Tests include:
 - Validation for invalid inputs
 """
 
+import asyncio
+import calendar
 from datetime import date, timedelta
+from operator import itemgetter
+from unittest.mock import patch
+from urllib.parse import urlencode
 
+import httpx
 import pytest
+import pytest_asyncio
 import zoneinfo
-from dateutil.relativedelta import relativedelta
-
-# Import the service - will need to adjust path based on test runner
-try:
-    from app.services.week_calculation import (
-        FutureDateError,
-        InvalidDateError,
-        InvalidTimezoneError,
-        WeekCalculationService,
-        WeekType,
-        calculate_current_week_index,
-        calculate_total_weeks,
-        get_life_progress,
-    )
-except ImportError:
-    # Alternative import path for pytest
-    import sys
-
-    sys.path.append("../../backend")
-    from app.services.week_calculation import (
-        FutureDateError,
-        InvalidDateError,
-        InvalidTimezoneError,
-        WeekCalculationService,
-        WeekType,
-        calculate_current_week_index,
-        calculate_total_weeks,
-        get_life_progress,
-    )
+from app.services.week_calculation import (
+    _TZ_CACHE,
+    FutureDateError,
+    InvalidDateError,
+    InvalidTimezoneError,
+    WeekCalculationService,
+    WeekType,
+    calculate_current_week_index,
+    calculate_total_weeks,
+    get_life_progress,
+)
+
+
+@pytest.fixture(scope="module")
+def client(stateless_client):
+    """Use the shared client, the week endpoints never touch the database."""
+    return stateless_client
+
+
+@pytest_asyncio.fixture
+async def async_client(client):
+    """Create an async test client over the module's shared app."""
+    transport = httpx.ASGITransport(app=client.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="module")
+def dob_and_iso():
+    """Date of birth shared by the life progress tests and its ISO string."""
+    dob = date(2000, 1, 1)
+    return dob, dob.isoformat()
+
+
+@pytest.fixture(scope="module")
+def openapi_schema(client):
+    """Generate the OpenAPI schema once for the documentation tests."""
+    return client.app.openapi()
+
+
+WEEK_SUMMARY_FIELDS = itemgetter(
+    "week_index",
+    "week_start",
+    "week_end",
+    "week_type",
+    "age_years",
+    "age_months",
+    "age_days",
+    "days_lived",
+    "is_current_week",
+)
+
+LIFE_PROGRESS_FIELDS = itemgetter(
+    "date_of_birth",
+    "lifespan_years",
+    "timezone",
+    "total_weeks",
+    "current_week_index",
+    "weeks_lived",
+    "weeks_remaining",
+    "progress_percentage",
+    "current_age",
+    "days_lived",
+    "current_week_info",
+)
+
+
+def _years_in_days(dob, years):
+    """Return the number of days from dob to its anniversary after the given years."""
+    end_year = dob.year + years
+    end_day = dob.day
+    if dob.month == 2 and dob.day == 29 and not calendar.isleap(end_year):
+        end_day = 28
+    return date(end_year, dob.month, end_day).toordinal() - dob.toordinal()
+
+
+def _week_index(dob, target):
+    """Return the 0-based week index of target since dob using day ordinals."""
+    return (target.toordinal() - dob.toordinal()) // 7
 
 
 class TestWeekCalculationService:
@@ -55,6 +114,8 @@ class TestWeekCalculationService:
 
     def test_validate_date_of_birth_future(self):
         """Test validation fails for future date of birth."""
+        # Read the clock here rather than using the session-wide today
+        # fixture: the service compares against the live date.today()
         future_dob = date.today() + timedelta(days=1)
         with pytest.raises(FutureDateError):
             WeekCalculationService.validate_date_of_birth(future_dob)
@@ -81,6 +142,17 @@ class TestWeekCalculationService:
         with pytest.raises(InvalidTimezoneError):
             WeekCalculationService.validate_timezone("Invalid/Timezone")
 
+    def test_validate_timezone_is_cached(self):
+        """Test valid timezones are loaded once and invalid ones are not cached."""
+        tz = WeekCalculationService.validate_timezone("Europe/London")
+
+        assert _TZ_CACHE["Europe/London"] is tz
+        assert WeekCalculationService.validate_timezone("Europe/London") is tz
+
+        with pytest.raises(InvalidTimezoneError):
+            WeekCalculationService.validate_timezone("Invalid/Timezone")
+        assert "Invalid/Timezone" not in _TZ_CACHE
+
     def test_calculate_total_weeks_basic(self):
         """Test basic total weeks calculation."""
         dob = date(1990, 1, 1)
@@ -88,9 +160,7 @@ class TestWeekCalculationService:
         total_weeks = WeekCalculationService.calculate_total_weeks(dob, lifespan)
 
         # 80 years should be approximately 80 * 52.17 weeks
-        expected = (
-            date(1990, 1, 1) + relativedelta(years=80) - date(1990, 1, 1)
-        ).days // 7
+        expected = _years_in_days(dob, lifespan) // 7
         assert total_weeks == expected
 
     def test_calculate_total_weeks_leap_year_handling(self):
@@ -100,9 +170,8 @@ class TestWeekCalculationService:
         lifespan = 4  # Will span one leap year
         total_weeks = WeekCalculationService.calculate_total_weeks(dob, lifespan)
 
-        # Calculate expected using dateutil
-        end_date = dob + relativedelta(years=lifespan)
-        expected = (end_date - dob).days // 7
+        # Feb 29 anniversaries fall back to Feb 28 in non-leap years
+        expected = _years_in_days(dob, lifespan) // 7
         assert total_weeks == expected
 
     def test_calculate_total_weeks_invalid_lifespan(self):
@@ -128,22 +197,43 @@ class TestWeekCalculationService:
         assert week_index >= 0
         assert week_index < 1000  # Less than ~19 years
 
+    @pytest.mark.usefixtures("tz_cache")
     def test_calculate_current_week_index_different_timezones(self):
         """Test current week calculation across different timezones."""
         dob = date(2020, 1, 1)
 
         # Test multiple timezones
         timezones = ["UTC", "America/New_York", "Europe/London", "Asia/Tokyo"]
-        results = []
+        results = WeekCalculationService.calculate_current_week_indices(dob, timezones)
 
-        for tz in timezones:
-            week_index = WeekCalculationService.calculate_current_week_index(dob, tz)
-            results.append(week_index)
-            assert week_index >= 0
+        assert len(results) == len(timezones)
+        assert all(week_index >= 0 for week_index in results)
 
         # Results should be close (within 1 week due to timezone differences)
         assert max(results) - min(results) <= 1
 
+    def test_calculate_current_week_indices_matches_single_calls(self):
+        """Test batch current week calculation matches the per-timezone result."""
+        dob = date(2000, 1, 1)
+
+        results = WeekCalculationService.calculate_current_week_indices(
+            dob, ["UTC", "Asia/Tokyo"]
+        )
+
+        assert results[0] == WeekCalculationService.calculate_current_week_index(
+            dob, "UTC"
+        )
+        assert results[1] == WeekCalculationService.calculate_current_week_index(
+            dob, "Asia/Tokyo"
+        )
+
+    def test_calculate_current_week_indices_invalid_timezone(self):
+        """Test batch current week calculation fails for an invalid timezone."""
+        with pytest.raises(InvalidTimezoneError):
+            WeekCalculationService.calculate_current_week_indices(
+                date(2000, 1, 1), ["UTC", "Invalid/Timezone"]
+            )
+
     def test_get_week_start_date(self):
         """Test getting week start date."""
         dob = date(2020, 1, 1)
@@ -176,17 +266,16 @@ class TestWeekCalculationService:
         """Test birthday week detection."""
         dob = date(1990, 6, 15)
 
-        # Find a week that contains a birthday anniversary
-        for year in range(2020, 2025):
-            birthday = date(year, 6, 15)
-            days_since_birth = (birthday - dob).days
-            week_index = days_since_birth // 7
+        # Candidate weeks containing the 2020-2024 birthday anniversaries
+        week_indices = [
+            _week_index(dob, date(year, 6, 15)) for year in range(2020, 2025)
+        ]
 
-            week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
-            if week_type == WeekType.BIRTHDAY:
-                break
-        else:
-            pytest.fail("Should have detected at least one birthday week")
+        assert any(
+            WeekCalculationService.detect_special_week_type(dob, week_index)
+            == WeekType.BIRTHDAY
+            for week_index in week_indices
+        ), "Should have detected at least one birthday week"
 
     def test_detect_special_week_year_start(self):
         """Test year-start week detection."""
@@ -194,8 +283,7 @@ class TestWeekCalculationService:
 
         # Find a week that contains January 1st, 2021
         jan_1_2021 = date(2021, 1, 1)
-        days_since_birth = (jan_1_2021 - dob).days
-        week_index = days_since_birth // 7
+        week_index = _week_index(dob, jan_1_2021)
 
         week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
         # Should detect year start, birthday, or be normal (depending on exact week boundaries)
@@ -207,21 +295,33 @@ class TestWeekCalculationService:
 
         # Check week containing leap day 2020
         leap_day = date(2020, 2, 29)
-        days_since_birth = (leap_day - dob).days
-        week_index = days_since_birth // 7
+        week_index = _week_index(dob, leap_day)
 
         week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
         # Should detect leap day or be normal
         assert week_type in [WeekType.LEAP_DAY, WeekType.NORMAL]
 
+    def test_detect_special_week_leap_day_birthday(self):
+        """Test leap day birthdays are only detected in leap years."""
+        dob = date(2000, 2, 29)
+
+        # 2020 is a leap year, so Feb 29 falls inside a birthday week
+        week_index = _week_index(dob, date(2020, 2, 29))
+        week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
+        assert week_type == WeekType.BIRTHDAY
+
+        # 2021 has no Feb 29, so the week around Feb 28 is not a birthday week
+        week_index = _week_index(dob, date(2021, 2, 28))
+        week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
+        assert week_type != WeekType.BIRTHDAY
+
     def test_detect_special_week_dst_transition(self):
         """Test DST transition week detection."""
         dob = date(2000, 1, 1)
 
         # March 2020 DST transition in New York (around March 8)
         dst_date = date(2020, 3, 8)
-        days_since_birth = (dst_date - dob).days
-        week_index = days_since_birth // 7
+        week_index = _week_index(dob, dst_date)
 
         week_type = WeekCalculationService.detect_special_week_type(
             dob, week_index, "America/New_York"
@@ -229,6 +329,44 @@ class TestWeekCalculationService:
         # Should detect DST transition or be normal
         assert week_type in [WeekType.DST_TRANSITION, WeekType.NORMAL]
 
+    def test_detect_special_week_type_is_cached(self):
+        """Test repeated special week lookups are served from the cache."""
+        dob = date(1990, 6, 15)
+        week_index = _week_index(dob, date(2021, 6, 15))
+
+        first = WeekCalculationService.detect_special_week_type(dob, week_index)
+        hits = WeekCalculationService.detect_special_week_type.cache_info().hits
+        second = WeekCalculationService.detect_special_week_type(dob, week_index)
+
+        assert first == second == WeekType.BIRTHDAY
+        assert WeekCalculationService.detect_special_week_type.cache_info().hits == (
+            hits + 1
+        )
+
+    def test_detect_special_week_types_matches_single_calls(self):
+        """Test bulk special week detection agrees with per-week detection."""
+        dob = date(1990, 6, 15)
+        start = _week_index(dob, date(2019, 12, 1))
+        week_indices = list(range(start, start + 60))
+
+        week_types = WeekCalculationService.detect_special_week_types(
+            dob, week_indices, "America/New_York"
+        )
+
+        assert week_types == [
+            WeekCalculationService.detect_special_week_type(
+                dob, week_index, "America/New_York"
+            )
+            for week_index in week_indices
+        ]
+        assert WeekType.BIRTHDAY in week_types
+        assert WeekType.YEAR_START in week_types
+
+    def test_detect_special_week_types_negative_index(self):
+        """Test bulk special week detection rejects negative week indices."""
+        with pytest.raises(ValueError):
+            WeekCalculationService.detect_special_week_types(date(1990, 6, 15), [0, -1])
+
     def test_get_week_summary(self):
         """Test getting comprehensive week summary."""
         dob = date(2000, 1, 1)
@@ -236,34 +374,62 @@ class TestWeekCalculationService:
 
         summary = WeekCalculationService.get_week_summary(dob, week_index, "UTC")
 
-        assert summary["week_index"] == week_index
-        assert "week_start" in summary
-        assert "week_end" in summary
-        assert "week_type" in summary
-        assert summary["age_years"] >= 0
-        assert summary["age_months"] >= 0
-        assert summary["age_days"] >= 0
-        assert summary["days_lived"] >= 0
-        assert isinstance(summary["is_current_week"], bool)
-
-    def test_calculate_life_progress(self):
+        # Unpacking raises a single KeyError if the summary shape regresses
+        (
+            summary_week_index,
+            week_start,
+            week_end,
+            week_type,
+            age_years,
+            age_months,
+            age_days,
+            days_lived,
+            is_current_week,
+        ) = WEEK_SUMMARY_FIELDS(summary)
+
+        assert summary_week_index == week_index
+        assert week_start
+        assert week_end
+        assert week_type
+        assert age_years >= 0
+        assert age_months >= 0
+        assert age_days >= 0
+        assert days_lived >= 0
+        assert isinstance(is_current_week, bool)
+
+    def test_calculate_life_progress(self, dob_and_iso):
         """Test comprehensive life progress calculation."""
-        dob = date(2000, 1, 1)
+        dob, dob_iso = dob_and_iso
         lifespan = 80
 
         progress = WeekCalculationService.calculate_life_progress(dob, lifespan, "UTC")
 
-        assert progress["date_of_birth"] == dob.isoformat()
-        assert progress["lifespan_years"] == lifespan
-        assert progress["timezone"] == "UTC"
-        assert progress["total_weeks"] > 0
-        assert progress["current_week_index"] >= 0
-        assert progress["weeks_lived"] > 0
-        assert progress["weeks_remaining"] >= 0
-        assert 0 <= progress["progress_percentage"] <= 100
-        assert "current_age" in progress
-        assert progress["days_lived"] > 0
-        assert "current_week_info" in progress
+        # Unpacking raises a single KeyError if the progress shape regresses
+        (
+            date_of_birth,
+            progress_lifespan,
+            timezone,
+            total_weeks,
+            current_week_index,
+            weeks_lived,
+            weeks_remaining,
+            progress_percentage,
+            current_age,
+            days_lived,
+            current_week_info,
+        ) = LIFE_PROGRESS_FIELDS(progress)
+
+        assert date_of_birth == dob_iso
+        assert progress_lifespan == lifespan
+        assert timezone == "UTC"
+        assert total_weeks > 0
+        assert current_week_index >= 0
+        assert weeks_lived > 0
+        assert weeks_remaining >= 0
+        assert 0 <= progress_percentage <= 100
+        assert current_age
+        assert days_lived > 0
+        assert current_week_info
 
     def test_leap_year_edge_cases(self):
         """Test edge cases involving leap years."""
@@ -305,6 +471,21 @@ class TestWeekCalculationService:
         current_week = WeekCalculationService.calculate_current_week_index(today, "UTC")
         assert current_week == 0
 
+    def test_same_day_dob_utc_skips_clock_lookup(self):
+        """Test a DOB of today in UTC returns week 0 without reading the clock."""
+        today = date.today()
+        with patch.object(
+            WeekCalculationService, "get_timezone_aware_datetime"
+        ) as get_now:
+            assert calculate_current_week_index(today, "UTC") == 0
+
+        get_now.assert_not_called()
+
+    def test_same_day_dob_invalid_timezone(self):
+        """Test a DOB of today still validates non-UTC timezone names."""
+        with pytest.raises(InvalidTimezoneError):
+            calculate_current_week_index(date.today(), "Invalid/Timezone")
+
     def test_negative_week_index(self):
         """Test handling of negative week index."""
         dob = date(2000, 1, 1)
@@ -328,10 +509,11 @@ class TestConvenienceFunctions:
         current_week = calculate_current_week_index(dob, "UTC")
         assert current_week >= 0
 
-    def test_get_life_progress_function(self):
+    def test_get_life_progress_function(self, dob_and_iso):
         """Test convenience function for life progress."""
-        dob = date(2000, 1, 1)
+        dob, dob_iso = dob_and_iso
         progress = get_life_progress(dob, 80, "UTC")
+        assert progress["date_of_birth"] == dob_iso
         assert "total_weeks" in progress
         assert "current_week_index" in progress
 
@@ -356,20 +538,42 @@ class TestValidationEdgeCases:
             WeekCalculationService.validate_timezone("america/new_york")  # wrong case
 
 
+# Scenarios shared by the parametrized total weeks tests
+TOTAL_WEEKS_SCENARIOS = [
+    (date(1990, 1, 1), 80),
+    (date(2000, 2, 29), 75),  # Leap day
+    (date(1950, 12, 31), 90),  # Year end
+    (date(1980, 6, 15), 70),  # Mid-year
+]
+
+API_TOTAL_WEEKS_SCENARIOS = [
+    ("1950-01-01", 90),
+    ("1980-06-15", 75),
+    ("2000-02-29", 80),  # Leap day
+    ("1970-12-31", 85),  # Year end
+]
+
+
+@pytest.fixture(scope="module")
+def expected_total_weeks():
+    """Expected total weeks for every parametrized scenario, computed once."""
+    scenarios = TOTAL_WEEKS_SCENARIOS + [
+        (date.fromisoformat(dob), lifespan)
+        for dob, lifespan in API_TOTAL_WEEKS_SCENARIOS
+    ]
+    return {
+        (dob, lifespan): _years_in_days(dob, lifespan) // 7
+        for dob, lifespan in scenarios
+    }
+
+
 # Parametrized tests for various scenarios
-@pytest.mark.parametrize(
-    "dob,lifespan",
-    [
-        (date(1990, 1, 1), 80),
-        (date(2000, 2, 29), 75),  # Leap day
-        (date(1950, 12, 31), 90),  # Year end
-        (date(1980, 6, 15), 70),  # Mid-year
-    ],
-)
-def test_total_weeks_various_scenarios(dob, lifespan):
+@pytest.mark.parametrize("dob,lifespan", TOTAL_WEEKS_SCENARIOS)
+def test_total_weeks_various_scenarios(dob, lifespan, expected_total_weeks):
     """Test total weeks calculation with various DOB and lifespan combinations."""
     total_weeks = WeekCalculationService.calculate_total_weeks(dob, lifespan)
     assert total_weeks > 0
+    assert total_weeks == expected_total_weeks[(dob, lifespan)]
 
     # Rough sanity check: should be around lifespan * 52
     assert abs(total_weeks - (lifespan * 52)) < (
@@ -388,8 +592,10 @@ def test_total_weeks_various_scenarios(dob, lifespan):
         "America/Los_Angeles",
     ],
 )
-def test_current_week_various_timezones(timezone):
+def test_current_week_various_timezones(timezone, tz_cache):
     """Test current week calculation with various timezones."""
+    assert WeekCalculationService.validate_timezone(timezone) is tz_cache[timezone]
+
     dob = date(2000, 1, 1)
     current_week = WeekCalculationService.calculate_current_week_index(dob, timezone)
     assert current_week >= 0
@@ -412,14 +618,22 @@ def test_week_type_enum_values(week_type):
     assert len(week_type.value) > 0
 
 
+@pytest.mark.xdist_group("week_api")
 class TestWeekCalculationAPIEndpoints:
     """Test cases for week calculation API endpoints."""
 
+    TOTAL_WEEKS_PATH = "/api/v1/weeks/total"
+    CURRENT_WEEK_PATH = "/api/v1/weeks/current"
+    TOTAL_WEEKS_URL = f"{TOTAL_WEEKS_PATH}?" + urlencode(
+        {"date_of_birth": "1990-01-15", "lifespan_years": 80}
+    )
+    CURRENT_WEEK_URL = f"{CURRENT_WEEK_PATH}?" + urlencode(
+        {"date_of_birth": "1990-01-15", "timezone": "UTC"}
+    )
+
     def test_get_total_weeks_valid_request(self, client):
         """Test GET /weeks/total endpoint with valid parameters."""
-        response = client.get(
-            "/api/v1/weeks/total?date_of_birth=1990-01-15&lifespan_years=80"
-        )
+        response = client.get(self.TOTAL_WEEKS_URL)
 
         assert response.status_code == 200
         data = response.json()
@@ -450,12 +664,8 @@ class TestWeekCalculationAPIEndpoints:
 
         assert response.status_code == 422  # Validation error
 
-    def test_get_total_weeks_future_date(self, client):
+    def test_get_total_weeks_future_date(self, client, future_date):
         """Test GET /weeks/total endpoint with future date of birth."""
-        from datetime import date, timedelta
-
-        future_date = (date.today() + timedelta(days=365)).isoformat()
-
         response = client.get(
             f"/api/v1/weeks/total?date_of_birth={future_date}&lifespan_years=80"
         )
@@ -498,9 +708,7 @@ class TestWeekCalculationAPIEndpoints:
 
     def test_get_current_week_valid_request(self, client):
         """Test GET /weeks/current endpoint with valid parameters."""
-        response = client.get(
-            "/api/v1/weeks/current?date_of_birth=1990-01-15&timezone=UTC"
-        )
+        response = client.get(self.CURRENT_WEEK_URL)
 
         assert response.status_code == 200
         data = response.json()
@@ -527,16 +735,25 @@ class TestWeekCalculationAPIEndpoints:
 
         assert data["timezone"] == "UTC"  # Default value
 
-    def test_get_current_week_different_timezones(self, client):
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("tz_cache")
+    async def test_get_current_week_different_timezones(self, async_client):
         """Test GET /weeks/current endpoint with different timezones."""
         dob = "1990-01-15"
         timezones = ["UTC", "America/New_York", "Europe/London", "Asia/Tokyo"]
-        results = []
 
-        for timezone in timezones:
-            response = client.get(
-                f"/api/v1/weeks/current?date_of_birth={dob}&timezone={timezone}"
+        responses = await asyncio.gather(
+            *(
+                async_client.get(
+                    f"{self.CURRENT_WEEK_PATH}?"
+                    + urlencode({"date_of_birth": dob, "timezone": timezone})
+                )
+                for timezone in timezones
             )
+        )
+
+        results = []
+        for timezone, response in zip(timezones, responses):
             assert response.status_code == 200
 
             data = response.json()
@@ -558,12 +775,8 @@ class TestWeekCalculationAPIEndpoints:
         assert "error" in data
         assert "InvalidTimezoneError" in data["error"]
 
-    def test_get_current_week_future_date(self, client):
+    def test_get_current_week_future_date(self, client, future_date):
         """Test GET /weeks/current endpoint with future date of birth."""
-        from datetime import date, timedelta
-
-        future_date = (date.today() + timedelta(days=365)).isoformat()
-
         response = client.get(
             f"/api/v1/weeks/current?date_of_birth={future_date}&timezone=UTC"
         )
@@ -584,14 +797,10 @@ class TestWeekCalculationAPIEndpoints:
         assert "error" in data
         assert "Date of birth must be after year 1900" in data["message"]
 
-    def test_get_current_week_today_birth(self, client):
+    def test_get_current_week_today_birth(self, client, today):
         """Test GET /weeks/current endpoint with today as date of birth."""
-        from datetime import date
-
-        today = date.today().isoformat()
-
         response = client.get(
-            f"/api/v1/weeks/current?date_of_birth={today}&timezone=UTC"
+            f"/api/v1/weeks/current?date_of_birth={today.isoformat()}&timezone=UTC"
         )
 
         assert response.status_code == 200
@@ -600,22 +809,26 @@ class TestWeekCalculationAPIEndpoints:
         assert data["current_week_index"] == 0
         assert data["weeks_lived"] == 1
 
-    def test_endpoints_consistency(self, client):
+    @pytest.mark.asyncio
+    async def test_endpoints_consistency(self, async_client):
         """Test that both GET endpoints return consistent data."""
         dob = "1990-01-15"
         lifespan = 80
 
-        # Get total weeks
-        total_response = client.get(
-            f"/api/v1/weeks/total?date_of_birth={dob}&lifespan_years={lifespan}"
+        # Get total weeks and current week concurrently
+        total_response, current_response = await asyncio.gather(
+            async_client.get(
+                f"{self.TOTAL_WEEKS_PATH}?"
+                + urlencode({"date_of_birth": dob, "lifespan_years": lifespan})
+            ),
+            async_client.get(
+                f"{self.CURRENT_WEEK_PATH}?"
+                + urlencode({"date_of_birth": dob, "timezone": "UTC"})
+            ),
         )
         assert total_response.status_code == 200
         total_data = total_response.json()
 
-        # Get current week
-        current_response = client.get(
-            f"/api/v1/weeks/current?date_of_birth={dob}&timezone=UTC"
-        )
         assert current_response.status_code == 200
         current_data = current_response.json()
 
@@ -635,19 +848,14 @@ class TestWeekCalculationAPIEndpoints:
         response = client.get("/api/v1/weeks/current?timezone=UTC")
         assert response.status_code == 422
 
-    @pytest.mark.parametrize(
-        "dob,lifespan",
-        [
-            ("1950-01-01", 90),
-            ("1980-06-15", 75),
-            ("2000-02-29", 80),  # Leap day
-            ("1970-12-31", 85),  # Year end
-        ],
-    )
-    def test_get_total_weeks_various_scenarios(self, client, dob, lifespan):
+    @pytest.mark.parametrize("dob,lifespan", API_TOTAL_WEEKS_SCENARIOS)
+    def test_get_total_weeks_various_scenarios(
+        self, client, dob, lifespan, expected_total_weeks
+    ):
         """Test GET /weeks/total endpoint with various scenarios."""
         response = client.get(
-            f"/api/v1/weeks/total?date_of_birth={dob}&lifespan_years={lifespan}"
+            f"{self.TOTAL_WEEKS_PATH}?"
+            + urlencode({"date_of_birth": dob, "lifespan_years": lifespan})
         )
 
         assert response.status_code == 200
@@ -656,6 +864,10 @@ class TestWeekCalculationAPIEndpoints:
         assert data["date_of_birth"] == dob
         assert data["lifespan_years"] == lifespan
         assert data["total_weeks"] > 0
+        assert (
+            data["total_weeks"]
+            == expected_total_weeks[(date.fromisoformat(dob), lifespan)]
+        )
         # Rough sanity check
         assert abs(data["total_weeks"] - (lifespan * 52)) < (lifespan * 2)
 
@@ -671,7 +883,8 @@ class TestWeekCalculationAPIEndpoints:
     def test_get_current_week_various_scenarios(self, client, dob, timezone):
         """Test GET /weeks/current endpoint with various scenarios."""
         response = client.get(
-            f"/api/v1/weeks/current?date_of_birth={dob}&timezone={timezone}"
+            f"{self.CURRENT_WEEK_PATH}?"
+            + urlencode({"date_of_birth": dob, "timezone": timezone})
         )
 
         assert response.status_code == 200
@@ -685,6 +898,7 @@ class TestWeekCalculationAPIEndpoints:
         assert data["current_week_index"] < 3000
 
 
+@pytest.mark.xdist_group("week_api")
 class TestWeekCalculationAPIDocumentation:
     """Test OpenAPI documentation for week calculation endpoints."""
 
@@ -705,10 +919,9 @@ class TestWeekCalculationAPIDocumentation:
         assert "get" in paths["/api/v1/weeks/total"]
         assert "get" in paths["/api/v1/weeks/current"]
 
-    def test_total_weeks_endpoint_documentation(self, client):
+    def test_total_weeks_endpoint_documentation(self, openapi_schema):
         """Test GET /weeks/total endpoint documentation."""
-        response = client.get("/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         total_endpoint = schema["paths"]["/api/v1/weeks/total"]["get"]
 
@@ -730,10 +943,9 @@ class TestWeekCalculationAPIDocumentation:
         assert "400" in responses
         assert "422" in responses
 
-    def test_current_week_endpoint_documentation(self, client):
+    def test_current_week_endpoint_documentation(self, openapi_schema):
         """Test GET /weeks/current endpoint documentation."""
-        response = client.get("/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         current_endpoint = schema["paths"]["/api/v1/weeks/current"]["get"]
 
@@ -755,10 +967,9 @@ class TestWeekCalculationAPIDocumentation:
         assert "400" in responses
         assert "422" in responses
 
-    def test_response_models_in_schema(self, client):
+    def test_response_models_in_schema(self, openapi_schema):
         """Test that response models are properly defined in schema."""
-        response = client.get("/openapi.json")
-        schema = response.json()
+        schema = openapi_schema
 
         # Check that our response models are in components
         components = schema.get("components", {})
@@ -786,52 +997,34 @@ class TestWeekCalculationAPIDocumentation:
         assert "weeks_lived" in props
 
 
-class TestWeekCalculationAPIErrorHandling:
-    """Test comprehensive error handling for week calculation API endpoints."""
+# Malformed query strings and the status each must produce
+ERROR_CASES = (
+    # GET /weeks/total
+    ("/api/v1/weeks/total", 422),  # No parameters
+    ("/api/v1/weeks/total?date_of_birth=", 422),  # Empty date
+    ("/api/v1/weeks/total?date_of_birth=not-a-date", 422),  # Invalid date format
+    ("/api/v1/weeks/total?date_of_birth=1990-13-50", 422),  # Invalid date values
+    (
+        "/api/v1/weeks/total?date_of_birth=1990-01-15&lifespan_years=abc",
+        422,
+    ),  # Non-numeric lifespan
+    # GET /weeks/current
+    ("/api/v1/weeks/current", 422),  # No parameters
+    ("/api/v1/weeks/current?date_of_birth=", 422),  # Empty date
+    ("/api/v1/weeks/current?date_of_birth=not-a-date", 422),  # Invalid date format
+    ("/api/v1/weeks/current?date_of_birth=1990-13-50", 422),  # Invalid date values
+)
 
-    def test_total_weeks_comprehensive_error_handling(self, client):
-        """Test comprehensive error handling for GET /weeks/total."""
-        # Test with malformed query parameters
-        test_cases = [
-            ("/api/v1/weeks/total", 422),  # No parameters
-            ("/api/v1/weeks/total?date_of_birth=", 422),  # Empty date
-            (
-                "/api/v1/weeks/total?date_of_birth=not-a-date",
-                422,
-            ),  # Invalid date format
-            (
-                "/api/v1/weeks/total?date_of_birth=1990-13-50",
-                422,
-            ),  # Invalid date values
-            (
-                "/api/v1/weeks/total?date_of_birth=1990-01-15&lifespan_years=abc",
-                422,
-            ),  # Non-numeric lifespan
-        ]
 
-        for url, expected_status in test_cases:
-            response = client.get(url)
-            assert response.status_code == expected_status, f"Failed for URL: {url}"
-
-    def test_current_week_comprehensive_error_handling(self, client):
-        """Test comprehensive error handling for GET /weeks/current."""
-        # Test with malformed query parameters
-        test_cases = [
-            ("/api/v1/weeks/current", 422),  # No parameters
-            ("/api/v1/weeks/current?date_of_birth=", 422),  # Empty date
-            (
-                "/api/v1/weeks/current?date_of_birth=not-a-date",
-                422,
-            ),  # Invalid date format
-            (
-                "/api/v1/weeks/current?date_of_birth=1990-13-50",
-                422,
-            ),  # Invalid date values
-        ]
+@pytest.mark.xdist_group("week_api")
+class TestWeekCalculationAPIErrorHandling:
+    """Test comprehensive error handling for week calculation API endpoints."""
 
-        for url, expected_status in test_cases:
-            response = client.get(url)
-            assert response.status_code == expected_status, f"Failed for URL: {url}"
+    @pytest.mark.parametrize("url,expected", ERROR_CASES)
+    def test_comprehensive_error_handling(self, client, url, expected):
+        """Test that malformed GET /weeks/total and /weeks/current requests fail."""
+        response = client.get(url)
+        assert response.status_code == expected
 
     def test_error_response_format(self, client):
         """Test that error responses follow the correct format."""
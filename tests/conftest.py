@@ -0,0 +1,46 @@
+"""
+Shared configuration and fixtures for the top-level test scripts.
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../backend"))
+
+from app.core.database import get_db
+
+# Development server used by the HTTP test scripts
+LIVE_SERVER_URL = "http://127.0.0.1:8000"
+
+
+def pytest_configure(config):
+    """Register the markers used by the HTTP test scripts."""
+    config.addinivalue_line(
+        "markers", "integration: end-to-end tests against the running API server"
+    )
+
+
+@pytest.fixture(scope="session")
+def db():
+    """Provide one database session shared by the whole test session."""
+    db_gen = get_db()
+    session = next(db_gen)
+
+    yield session
+
+    # Closing the generator runs get_db's cleanup, which closes the session
+    db_gen.close()
+
+
+@pytest.fixture(scope="session")
+def live_server():
+    """Skip the HTTP test scripts when the development server is not running."""
+    try:
+        requests.get(f"{LIVE_SERVER_URL}/health", timeout=2)
+    except requests.exceptions.ConnectionError:
+        pytest.skip(f"API server not running at {LIVE_SERVER_URL}")
+    return LIVE_SERVER_URL
@@ -1,80 +1,124 @@
-import json
-
-import requests
-
-base_url = "http://127.0.0.1:8000"
-
-print("=== Testing Week Calculation API Error Handling ===\n")
-
-# Test 1: Future date of birth
-print("1. Testing Future DOB Error:")
-try:
-    data = {"date_of_birth": "2030-01-01", "timezone": "UTC"}
-    response = requests.post(f"{base_url}/api/v1/weeks/current-week", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 2: Invalid timezone
-print("2. Testing Invalid Timezone:")
-try:
-    data = {"date_of_birth": "1990-01-15", "timezone": "Invalid/Timezone"}
-    response = requests.post(f"{base_url}/api/v1/weeks/current-week", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 3: Invalid lifespan
-print("3. Testing Invalid Lifespan:")
-try:
-    data = {
-        "date_of_birth": "1990-01-15",
-        "lifespan_years": 200,  # Too high
-        "timezone": "UTC",
-    }
-    response = requests.post(f"{base_url}/api/v1/weeks/total-weeks", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 4: Edge case - leap year DOB
-print("4. Testing Leap Year DOB:")
-try:
-    data = {
-        "date_of_birth": "2000-02-29",  # Leap day
-        "lifespan_years": 80,
-        "timezone": "UTC",
-    }
-    response = requests.post(f"{base_url}/api/v1/weeks/total-weeks", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 5: Week summary with special week detection
-print("5. Testing Week Summary:")
-try:
-    data = {
-        "date_of_birth": "1990-06-15",
-        "week_index": 1800,  # Around 34 years old
-        "timezone": "America/New_York",
-    }
-    response = requests.post(f"{base_url}/api/v1/weeks/week-summary", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50)
-print("Error Handling Testing Complete!")
+import asyncio
+import logging
+import os
+import sys
+
+import httpx
+import orjson
+import pytest
+
+LOG = logging.getLogger(__name__)
+
+# Set LIFETIME_TEST_VERBOSE=1 to log every response body
+VERBOSE = os.getenv("LIFETIME_TEST_VERBOSE") == "1"
+
+BASE_URL = "http://127.0.0.1:8000"
+URL_CURRENT_WEEK = "/api/v1/weeks/current-week"
+URL_TOTAL_WEEKS = "/api/v1/weeks/total-weeks"
+URL_WEEK_SUMMARY = "/api/v1/weeks/week-summary"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies, serialized once at import time
+PAYLOADS = {
+    "future_dob": orjson.dumps({"date_of_birth": "2030-01-01", "timezone": "UTC"}),
+    "invalid_timezone": orjson.dumps(
+        {"date_of_birth": "1990-01-15", "timezone": "Invalid/Timezone"}
+    ),
+    "invalid_lifespan": orjson.dumps(
+        {
+            "date_of_birth": "1990-01-15",
+            "lifespan_years": 200,  # Too high
+            "timezone": "UTC",
+        }
+    ),
+    "leap_year_dob": orjson.dumps(
+        {
+            "date_of_birth": "2000-02-29",  # Leap day
+            "lifespan_years": 80,
+            "timezone": "UTC",
+        }
+    ),
+    "week_summary": orjson.dumps(
+        {
+            "date_of_birth": "1990-06-15",
+            "week_index": 1800,  # Around 34 years old
+            "timezone": "America/New_York",
+        }
+    ),
+}
+
+# Independent error probes: (title, path, serialized JSON body)
+PROBES = [
+    ("1. Testing Future DOB Error", URL_CURRENT_WEEK, PAYLOADS["future_dob"]),
+    (
+        "2. Testing Invalid Timezone",
+        URL_CURRENT_WEEK,
+        PAYLOADS["invalid_timezone"],
+    ),
+    (
+        "3. Testing Invalid Lifespan",
+        URL_TOTAL_WEEKS,
+        PAYLOADS["invalid_lifespan"],
+    ),
+    ("4. Testing Leap Year DOB", URL_TOTAL_WEEKS, PAYLOADS["leap_year_dob"]),
+    ("5. Testing Week Summary", URL_WEEK_SUMMARY, PAYLOADS["week_summary"]),
+]
+
+
+async def send_probes():
+    """Send every probe concurrently, returning responses or exceptions in order."""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10) as client:
+        # The probes are independent, so dispatch them all at once
+        return await asyncio.gather(
+            *(
+                client.post(path, content=payload, headers=JSON_HEADERS)
+                for _, path, payload in PROBES
+            ),
+            return_exceptions=True,
+        )
+
+
+async def main():
+    # Collect the report and write it in one go at the end
+    output = ["=== Testing Week Calculation API Error Handling ===\n\n"]
+
+    results = await send_probes()
+
+    # Report in probe order so the output reads like the sequential run
+    for index, ((title, *_), result) in enumerate(zip(PROBES, results)):
+        if index:
+            output.append("\n" + "=" * 50 + "\n\n")
+        output.append(f"{title}:\n")
+        try:
+            if isinstance(result, Exception):
+                raise result
+            output.append(f"Status: {result.status_code}\n")
+            if VERBOSE:
+                data = orjson.loads(result.content)
+                LOG.info(
+                    "%s response: %s",
+                    title,
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
+                )
+        except Exception as e:
+            output.append(f"Error: {e}\n")
+
+    output.append("\n" + "=" * 50 + "\n")
+    output.append("Error Handling Testing Complete!\n")
+    sys.stdout.writelines(output)
+
+
+@pytest.mark.usefixtures("live_server")
+def test_error_probes():
+    """Test every error handling probe gets an expected status."""
+    results = asyncio.run(send_probes())
+
+    for (title, *_), result in zip(PROBES, results):
+        assert not isinstance(result, Exception), f"{title}: {result}"
+        assert result.status_code in (200, 400, 422), title
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    LOG.setLevel(logging.INFO)
+    asyncio.run(main())
@@ -1,70 +1,135 @@
-import json
+import asyncio
+import logging
+import os
+import sys
 
-import requests
+import httpx
+import orjson
+import pytest
+
+LOG = logging.getLogger(__name__)
+
+# Set LIFETIME_TEST_VERBOSE=1 to log every response body
+VERBOSE = os.getenv("LIFETIME_TEST_VERBOSE") == "1"
 
 # Test basic API endpoints
-base_url = "http://127.0.0.1:8000"
-
-print("=== Testing Week Calculation API ===\n")
-
-# Test 1: Total weeks calculation
-print("1. Testing Total Weeks Calculation:")
-try:
-    data = {"date_of_birth": "1990-01-15", "lifespan_years": 80, "timezone": "UTC"}
-    response = requests.post(f"{base_url}/api/v1/weeks/total-weeks", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 2: Current week calculation
-print("2. Testing Current Week Calculation:")
-try:
-    data = {"date_of_birth": "1990-01-15", "timezone": "America/New_York"}
-    response = requests.post(f"{base_url}/api/v1/weeks/current-week", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 3: Life progress calculation
-print("3. Testing Life Progress Calculation:")
-try:
-    data = {
-        "date_of_birth": "1985-06-15",
-        "lifespan_years": 85,
-        "timezone": "Europe/London",
-    }
-    response = requests.post(f"{base_url}/api/v1/weeks/life-progress", json=data)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-# Test 4: Quick endpoints
-print("4. Testing Quick Current Week (GET):")
-try:
-    response = requests.get(f"{base_url}/api/v1/weeks/current-week/1985-03-20")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50 + "\n")
-
-print("5. Testing Quick Total Weeks (GET):")
-try:
-    response = requests.get(f"{base_url}/api/v1/weeks/total-weeks/1985-03-20/75")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-except Exception as e:
-    print(f"Error: {e}")
-
-print("\n" + "=" * 50)
-print("API Testing Complete!")
+BASE_URL = "http://127.0.0.1:8000"
+URL_TOTAL_WEEKS = "/api/v1/weeks/total-weeks"
+URL_CURRENT_WEEK = "/api/v1/weeks/current-week"
+URL_LIFE_PROGRESS = "/api/v1/weeks/life-progress"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies, serialized once at import time
+PAYLOADS = {
+    "total_weeks": orjson.dumps(
+        {"date_of_birth": "1990-01-15", "lifespan_years": 80, "timezone": "UTC"}
+    ),
+    "current_week": orjson.dumps(
+        {"date_of_birth": "1990-01-15", "timezone": "America/New_York"}
+    ),
+    "life_progress": orjson.dumps(
+        {
+            "date_of_birth": "1985-06-15",
+            "lifespan_years": 85,
+            "timezone": "Europe/London",
+        }
+    ),
+}
+
+# Independent probes: (title, method, path, serialized JSON body)
+PROBES = [
+    (
+        "1. Testing Total Weeks Calculation",
+        "POST",
+        URL_TOTAL_WEEKS,
+        PAYLOADS["total_weeks"],
+    ),
+    (
+        "2. Testing Current Week Calculation",
+        "POST",
+        URL_CURRENT_WEEK,
+        PAYLOADS["current_week"],
+    ),
+    (
+        "3. Testing Life Progress Calculation",
+        "POST",
+        URL_LIFE_PROGRESS,
+        PAYLOADS["life_progress"],
+    ),
+    (
+        "4. Testing Quick Current Week (GET)",
+        "GET",
+        f"{URL_CURRENT_WEEK}/1985-03-20",
+        None,
+    ),
+    (
+        "5. Testing Quick Total Weeks (GET)",
+        "GET",
+        f"{URL_TOTAL_WEEKS}/1985-03-20/75",
+        None,
+    ),
+]
+
+
+async def send_probes():
+    """Send every probe concurrently, returning responses or exceptions in order."""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10) as client:
+        # The probes are independent, so dispatch them all at once
+        return await asyncio.gather(
+            *(
+                client.request(
+                    method,
+                    path,
+                    content=payload,
+                    headers=JSON_HEADERS if payload is not None else None,
+                )
+                for _, method, path, payload in PROBES
+            ),
+            return_exceptions=True,
+        )
+
+
+async def main():
+    # Collect the report and write it in one go at the end
+    output = ["=== Testing Week Calculation API ===\n\n"]
+
+    results = await send_probes()
+
+    # Report in probe order so the output reads like the sequential run
+    for index, ((title, *_), result) in enumerate(zip(PROBES, results)):
+        if index:
+            output.append("\n" + "=" * 50 + "\n\n")
+        output.append(f"{title}:\n")
+        try:
+            if isinstance(result, Exception):
+                raise result
+            output.append(f"Status: {result.status_code}\n")
+            if VERBOSE:
+                data = orjson.loads(result.content)
+                LOG.info(
+                    "%s response: %s",
+                    title,
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
+                )
+        except Exception as e:
+            output.append(f"Error: {e}\n")
+
+    output.append("\n" + "=" * 50 + "\n")
+    output.append("API Testing Complete!\n")
+    sys.stdout.writelines(output)
+
+
+@pytest.mark.usefixtures("live_server")
+def test_quick_probes():
+    """Test every week calculation probe gets an expected status."""
+    results = asyncio.run(send_probes())
+
+    for (title, *_), result in zip(PROBES, results):
+        assert not isinstance(result, Exception), f"{title}: {result}"
+        assert result.status_code in (200, 400, 422), title
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    LOG.setLevel(logging.INFO)
+    asyncio.run(main())
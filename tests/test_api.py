@@ -3,114 +3,142 @@ Simple test script for week calculation API endpoints.
 """
 
 import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
 import requests
-
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOG = logging.getLogger(__name__)
+
+# Set LIFETIME_TEST_VERBOSE=1 to log every response body
+VERBOSE = os.getenv("LIFETIME_TEST_VERBOSE") == "1"
+
+# One adapter for every session in this process: a pool large enough for the
+# concurrent probes, and no retries so failures surface immediately
+ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=0))
+
+# Independent, side-effect free probes: (title, method, path, JSON body)
+API_PROBES = [
+    ("1. Testing API Health", "GET", "/health", None),
+    (
+        "2. Testing Week Calculation Service Health",
+        "GET",
+        "/api/v1/weeks/health",
+        None,
+    ),
+    (
+        "3. Testing Total Weeks Calculation",
+        "POST",
+        "/api/v1/weeks/total-weeks",
+        {"date_of_birth": "1990-01-15", "lifespan_years": 80, "timezone": "UTC"},
+    ),
+    (
+        "4. Testing Current Week Calculation",
+        "POST",
+        "/api/v1/weeks/current-week",
+        {"date_of_birth": "1990-01-15", "timezone": "America/New_York"},
+    ),
+    (
+        "5. Testing Week Summary",
+        "POST",
+        "/api/v1/weeks/week-summary",
+        {
+            "date_of_birth": "1990-01-15",
+            "week_index": 1800,  # ~34 years old
+            "timezone": "UTC",
+        },
+    ),
+    (
+        "6. Testing Life Progress Calculation",
+        "POST",
+        "/api/v1/weeks/life-progress",
+        {
+            "date_of_birth": "1990-06-15",
+            "lifespan_years": 85,
+            "timezone": "Europe/London",
+        },
+    ),
+    (
+        "7. Testing Quick Current Week (GET)",
+        "GET",
+        "/api/v1/weeks/current-week/1985-03-20",
+        None,
+    ),
+    (
+        "8. Testing Quick Total Weeks (GET)",
+        "GET",
+        "/api/v1/weeks/total-weeks/1985-03-20/75",
+        None,
+    ),
+    (
+        "9. Testing Error Handling (Future DOB)",
+        "POST",
+        "/api/v1/weeks/current-week",
+        {"date_of_birth": "2030-01-01", "timezone": "UTC"},
+    ),
+]
+
+
+@pytest.mark.usefixtures("live_server")
 def test_api_endpoints():
     """Test the week calculation API endpoints."""
     base_url = "http://127.0.0.1:8000"
+    failures = []
 
     print("Testing Week Calculation API")
     print("=" * 50)
 
-    # Test 1: API Health
-    print("\n1. Testing API Health:")
-    try:
-        response = requests.get(f"{base_url}/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 2: Week calculation service health
-    print("\n2. Testing Week Calculation Service Health:")
-    try:
-        response = requests.get(f"{base_url}/api/v1/weeks/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 3: Calculate total weeks
-    print("\n3. Testing Total Weeks Calculation:")
-    try:
-        data = {"date_of_birth": "1990-01-15", "lifespan_years": 80, "timezone": "UTC"}
-        response = requests.post(f"{base_url}/api/v1/weeks/total-weeks", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 4: Calculate current week
-    print("\n4. Testing Current Week Calculation:")
-    try:
-        data = {"date_of_birth": "1990-01-15", "timezone": "America/New_York"}
-        response = requests.post(f"{base_url}/api/v1/weeks/current-week", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 5: Get week summary
-    print("\n5. Testing Week Summary:")
-    try:
-        data = {
-            "date_of_birth": "1990-01-15",
-            "week_index": 1800,  # ~34 years old
-            "timezone": "UTC",
-        }
-        response = requests.post(f"{base_url}/api/v1/weeks/week-summary", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 6: Calculate life progress
-    print("\n6. Testing Life Progress Calculation:")
-    try:
-        data = {
-            "date_of_birth": "1990-06-15",
-            "lifespan_years": 85,
-            "timezone": "Europe/London",
-        }
-        response = requests.post(f"{base_url}/api/v1/weeks/life-progress", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 7: Quick current week (GET endpoint)
-    print("\n7. Testing Quick Current Week (GET):")
-    try:
-        response = requests.get(f"{base_url}/api/v1/weeks/current-week/1985-03-20")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 8: Quick total weeks (GET endpoint)
-    print("\n8. Testing Quick Total Weeks (GET):")
-    try:
-        response = requests.get(f"{base_url}/api/v1/weeks/total-weeks/1985-03-20/75")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
-
-    # Test 9: Error handling - future DOB
-    print("\n9. Testing Error Handling (Future DOB):")
+    # requests.Session is not documented as thread-safe, so each worker thread
+    # gets its own session; they share ADAPTER and with it one connection pool
+    local = threading.local()
+    sessions = []
+
+    def send(probe):
+        _, method, path, data = probe
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+            session.mount("http://", ADAPTER)
+            sessions.append(session)
+        # None of the probed endpoints redirect
+        return session.request(
+            method, f"{base_url}{path}", json=data, allow_redirects=False
+        )
+
     try:
-        data = {"date_of_birth": "2030-01-01", "timezone": "UTC"}
-        response = requests.post(f"{base_url}/api/v1/weeks/current-week", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except Exception as e:
-        print(f"Error: {e}")
+        # The probes are independent, so dispatch them all at once
+        with ThreadPoolExecutor(max_workers=len(API_PROBES)) as executor:
+            futures = [executor.submit(send, probe) for probe in API_PROBES]
+
+            # Report in probe order so the output reads like the sequential run
+            for (title, *_), future in zip(API_PROBES, futures):
+                print(f"\n{title}:")
+                try:
+                    response = future.result()
+                    print(f"Status: {response.status_code}")
+                    if VERBOSE:
+                        LOG.info("Response: %s", json.dumps(response.json(), indent=2))
+                    if response.status_code not in (200, 400, 422):
+                        failures.append(title)
+                except Exception as e:
+                    print(f"Error: {e}")
+                    failures.append(title)
+    finally:
+        for session in sessions:
+            session.close()
 
     print("\n" + "=" * 50)
     print("API Testing Complete!")
 
+    assert not failures, f"Failed probes: {failures}"
+
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    LOG.setLevel(logging.INFO)
     test_api_endpoints()
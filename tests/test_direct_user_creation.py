@@ -3,24 +3,24 @@
 Direct database test for user creation functionality.
 """
 
+import os
 import sys
 
-sys.path.append("backend")
+if __name__ == "__main__":
+    # Under pytest, tests/conftest.py puts backend/ on the path; standalone
+    # runs need to do it themselves before importing the app
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../backend"))
 
 from app.core.database import get_db
 from app.services.user import UserService
 from sqlalchemy.orm import Session
 
 
-def test_direct_user_creation():
+def test_direct_user_creation(db: Session):
     """Test user creation directly through the service layer."""
 
     print("🧪 Testing direct user creation through service layer...")
 
-    # Get database session
-    db_gen = get_db()
-    db: Session = next(db_gen)
-
     try:
         # Test data
         import time
@@ -74,11 +74,13 @@ def test_direct_user_creation():
         import traceback
 
         traceback.print_exc()
-    finally:
-        db.close()
 
     print("\n🎉 Direct user creation test completed!")
 
 
 if __name__ == "__main__":
-    test_direct_user_creation()
+    db_gen = get_db()
+    try:
+        test_direct_user_creation(next(db_gen))
+    finally:
+        db_gen.close()
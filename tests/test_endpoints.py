@@ -4,98 +4,125 @@ Quick test script for the new GET endpoints.
 """
 
 import json
+import logging
+import os
 from datetime import date
 
+import pytest
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOG = logging.getLogger(__name__)
+
+# Set LIFETIME_TEST_VERBOSE=1 to log every response body
+VERBOSE = os.getenv("LIFETIME_TEST_VERBOSE") == "1"
+
+# One adapter for every session in this process, with no retries so a
+# server that is not running is reported immediately
+ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=0))
+
+OPENAPI_URL = "http://127.0.0.1:8000/openapi.json"
+
+# Documented path keys, fetched once per process by get_openapi_paths()
+_openapi_paths = None
+
+
+def get_openapi_paths(session):
+    """Return the documented API paths as a frozenset, fetching the schema once.
+
+    Args:
+        session: requests session used to download the schema
+
+    Returns:
+        frozenset of path keys from the OpenAPI schema, or None if the
+        schema could not be retrieved
+    """
+    global _openapi_paths
+    if _openapi_paths is None:
+        response = session.get(OPENAPI_URL, allow_redirects=False)
+        print(f"OpenAPI Status Code: {response.status_code}")
+        if response.status_code != 200:
+            return None
+        _openapi_paths = frozenset(response.json().get("paths", {}))
+    return _openapi_paths
 
 
 # Test the GET endpoints
+@pytest.mark.usefixtures("live_server")
 def test_endpoints():
     base_url = "http://127.0.0.1:8000/api/v1"
 
-    print("Testing Week Calculation GET Endpoints")
-    print("=" * 50)
+    # Reuse one pooled keep-alive connection for every request
+    with requests.Session() as session:
+        session.mount("http://", ADAPTER)
+        print("Testing Week Calculation GET Endpoints")
+        print("=" * 50)
 
-    # Test GET /weeks/total
-    print("\n1. Testing GET /weeks/total endpoint:")
-    try:
-        response = requests.get(
+        # Test GET /weeks/total
+        print("\n1. Testing GET /weeks/total endpoint:")
+        response = session.get(
             f"{base_url}/weeks/total",
             params={"date_of_birth": "1990-01-15", "lifespan_years": 80},
+            allow_redirects=False,
         )
 
         print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-        else:
+        if response.status_code != 200:
             print(f"Error: {response.text}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running. Please start the server first.")
-        return
+        elif VERBOSE:
+            LOG.info("Response: %s", json.dumps(response.json(), indent=2))
+        assert response.status_code == 200
 
-    # Test GET /weeks/current
-    print("\n2. Testing GET /weeks/current endpoint:")
-    try:
-        response = requests.get(
+        # Test GET /weeks/current
+        print("\n2. Testing GET /weeks/current endpoint:")
+        response = session.get(
             f"{base_url}/weeks/current",
             params={"date_of_birth": "1990-01-15", "timezone": "UTC"},
+            allow_redirects=False,
         )
 
         print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-        else:
+        if response.status_code != 200:
             print(f"Error: {response.text}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running. Please start the server first.")
-        return
+        elif VERBOSE:
+            LOG.info("Response: %s", json.dumps(response.json(), indent=2))
+        assert response.status_code == 200
 
-    # Test with different timezone
-    print("\n3. Testing with different timezone (America/New_York):")
-    try:
-        response = requests.get(
+        # Test with different timezone
+        print("\n3. Testing with different timezone (America/New_York):")
+        response = session.get(
             f"{base_url}/weeks/current",
             params={"date_of_birth": "1990-01-15", "timezone": "America/New_York"},
+            allow_redirects=False,
         )
 
         print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Response: {json.dumps(data, indent=2)}")
-        else:
+        if response.status_code != 200:
             print(f"Error: {response.text}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running. Please start the server first.")
-        return
+        elif VERBOSE:
+            LOG.info("Response: %s", json.dumps(response.json(), indent=2))
+        assert response.status_code == 200
 
-    # Test error handling - future date
-    print("\n4. Testing error handling (future date):")
-    try:
+        # Test error handling - future date
+        print("\n4. Testing error handling (future date):")
         future_date = date.today().replace(year=date.today().year + 1).isoformat()
-        response = requests.get(
+        response = session.get(
             f"{base_url}/weeks/total",
             params={"date_of_birth": future_date, "lifespan_years": 80},
+            allow_redirects=False,
         )
 
         print(f"Status Code: {response.status_code}")
-        data = response.json()
-        print(f"Error Response: {json.dumps(data, indent=2)}")
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running. Please start the server first.")
-        return
+        if VERBOSE:
+            LOG.info("Error Response: %s", json.dumps(response.json(), indent=2))
+        assert response.status_code in (400, 422)
 
-    # Test OpenAPI docs
-    print("\n5. Testing OpenAPI documentation:")
-    try:
-        response = requests.get("http://127.0.0.1:8000/openapi.json")
-        print(f"OpenAPI Status Code: {response.status_code}")
-
-        if response.status_code == 200:
-            schema = response.json()
-            paths = schema.get("paths", {})
+        # Test OpenAPI docs
+        print("\n5. Testing OpenAPI documentation:")
+        paths = get_openapi_paths(session)
 
+        if paths is not None:
             if "/api/v1/weeks/total" in paths:
                 print("✅ GET /weeks/total endpoint documented")
             else:
@@ -106,13 +133,17 @@ def test_endpoints():
             else:
                 print("❌ GET /weeks/current endpoint not found in docs")
 
-    except requests.exceptions.ConnectionError:
-        print("❌ Server not running. Please start the server first.")
-        return
+        assert paths is not None
+        assert {"/api/v1/weeks/total", "/api/v1/weeks/current"} <= paths
 
-    print("\n" + "=" * 50)
-    print("✅ All endpoint tests completed!")
+        print("\n" + "=" * 50)
+        print("✅ All endpoint tests completed!")
 
 
 if __name__ == "__main__":
-    test_endpoints()
+    logging.basicConfig(format="%(message)s")
+    LOG.setLevel(logging.INFO)
+    try:
+        test_endpoints()
+    except requests.exceptions.ConnectionError:
+        print("❌ Server not running. Please start the server first.")
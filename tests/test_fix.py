@@ -3,13 +3,16 @@
 Test script to verify the fix for multiple birthday/new year weeks.
 """
 
+import os
 import sys
-
-sys.path.append("backend")
-
 from datetime import date
 
-from backend.app.services.week_calculation import WeekCalculationService, WeekType
+if __name__ == "__main__":
+    # Under pytest, tests/conftest.py puts backend/ on the path; standalone
+    # runs need to do it themselves before importing the app
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../backend"))
+
+from app.services.week_calculation import WeekCalculationService, WeekType
 
 
 def test_birthday_weeks_fix():
@@ -19,24 +22,28 @@ def test_birthday_weeks_fix():
     # Use DOB June 15, 1990
     dob = date(1990, 6, 15)
 
-    # Test years 2020-2025
-    birthday_weeks = []
-    for year in range(2020, 2026):
-        # Find weeks around the birthday for this year
-        birthday_date = date(year, 6, 15)
-        days_since_birth = (birthday_date - dob).days
-
-        # Check a range of weeks around the birthday
-        for week_offset in range(-2, 3):  # Check 5 weeks around the birthday
-            week_index = (days_since_birth // 7) + week_offset
-            if week_index < 0:
-                continue
-
-            week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
-            if week_type == WeekType.BIRTHDAY:
-                week_start = WeekCalculationService.get_week_start_date(dob, week_index)
-                week_end = WeekCalculationService.get_week_end_date(dob, week_index)
-                birthday_weeks.append((year, week_index, week_start, week_end))
+    # Test years 2020-2025, checking 5 weeks around each birthday
+    candidates = [
+        (year, (date(year, 6, 15) - dob).days // 7 + week_offset)
+        for year in range(2020, 2026)
+        for week_offset in range(-2, 3)
+    ]
+    candidates = [(year, idx) for year, idx in candidates if idx >= 0]
+
+    # Classify every candidate week in one call, then only look at the hits
+    week_types = WeekCalculationService.detect_special_week_types(
+        dob, [week_index for _, week_index in candidates]
+    )
+    birthday_weeks = [
+        (
+            year,
+            week_index,
+            WeekCalculationService.get_week_start_date(dob, week_index),
+            WeekCalculationService.get_week_end_date(dob, week_index),
+        )
+        for (year, week_index), week_type in zip(candidates, week_types)
+        if week_type == WeekType.BIRTHDAY
+    ]
 
     print(f"Found {len(birthday_weeks)} birthday weeks:")
     for year, week_idx, start, end in birthday_weeks:
@@ -64,24 +71,28 @@ def test_new_year_weeks_fix():
     # Use DOB June 15, 1990 (away from Jan 1)
     dob = date(1990, 6, 15)
 
-    # Test years 2020-2025
-    new_year_weeks = []
-    for year in range(2020, 2026):
-        # Find weeks around January 1st for this year
-        jan_1 = date(year, 1, 1)
-        days_since_birth = (jan_1 - dob).days
-
-        # Check a range of weeks around January 1st
-        for week_offset in range(-2, 3):  # Check 5 weeks around Jan 1
-            week_index = (days_since_birth // 7) + week_offset
-            if week_index < 0:
-                continue
-
-            week_type = WeekCalculationService.detect_special_week_type(dob, week_index)
-            if week_type == WeekType.YEAR_START:
-                week_start = WeekCalculationService.get_week_start_date(dob, week_index)
-                week_end = WeekCalculationService.get_week_end_date(dob, week_index)
-                new_year_weeks.append((year, week_index, week_start, week_end))
+    # Test years 2020-2025, checking 5 weeks around each January 1st
+    candidates = [
+        (year, (date(year, 1, 1) - dob).days // 7 + week_offset)
+        for year in range(2020, 2026)
+        for week_offset in range(-2, 3)
+    ]
+    candidates = [(year, idx) for year, idx in candidates if idx >= 0]
+
+    # Classify every candidate week in one call, then only look at the hits
+    week_types = WeekCalculationService.detect_special_week_types(
+        dob, [week_index for _, week_index in candidates]
+    )
+    new_year_weeks = [
+        (
+            year,
+            week_index,
+            WeekCalculationService.get_week_start_date(dob, week_index),
+            WeekCalculationService.get_week_end_date(dob, week_index),
+        )
+        for (year, week_index), week_type in zip(candidates, week_types)
+        if week_type == WeekType.YEAR_START
+    ]
 
     print(f"Found {len(new_year_weeks)} new year weeks:")
     for year, week_idx, start, end in new_year_weeks:
@@ -132,14 +143,24 @@ def test_edge_cases():
     assert True, "Edge cases test completed successfully"
 
 
+def _passes(test):
+    """Run a test function standalone, reporting whether its asserts held."""
+    try:
+        test()
+    except AssertionError as e:
+        print(f"    FAILED: {e}")
+        return False
+    return True
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Testing Week Calculation Fix")
     print("=" * 60)
 
-    birthday_ok = test_birthday_weeks_fix()
-    new_year_ok = test_new_year_weeks_fix()
-    edge_cases_ok = test_edge_cases()
+    birthday_ok = _passes(test_birthday_weeks_fix)
+    new_year_ok = _passes(test_new_year_weeks_fix)
+    edge_cases_ok = _passes(test_edge_cases)
 
     print("\n" + "=" * 60)
     print("RESULTS:")
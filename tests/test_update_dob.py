@@ -3,120 +3,115 @@
 Test script specifically for testing date of birth updates in name-based user functionality.
 """
 
-import requests
+from types import MappingProxyType
+from urllib.parse import quote
+
+import httpx
+import orjson
+import pytest
 
 # API base URL
 BASE_URL = "http://127.0.0.1:8000/api/v1"
+USERS_BY_NAME_URL = f"{BASE_URL}/users/by-name"
 
+# Fail fast instead of hanging a worker on a stuck server: 1s connect, 5s read
+DEFAULT_TIMEOUT = httpx.Timeout(5.0, connect=1.0)
 
-def test_date_of_birth_update():
-    """Test that date of birth gets updated when creating user with existing name."""
-
-    print("🧪 Testing date of birth update functionality...")
+# Profile fields the by-name endpoint should overwrite for an existing user
+UPDATED_FIELDS = ("date_of_birth", "lifespan", "theme", "font_size")
 
-    # Initial user data
-    initial_data = {
+# Baseline user data; posting it again resets an existing user to these values
+INITIAL_DATA = MappingProxyType(
+    {
         "full_name": "Test Update User",
         "date_of_birth": "1990-01-01",
         "lifespan": 80,
         "theme": "light",
         "font_size": 14,
     }
+)
 
-    print(f"\n1. Creating initial user: {initial_data['full_name']}")
-    print(f"   Initial DOB: {initial_data['date_of_birth']}")
-
-    # Create initial user
-    response1 = requests.post(f"{BASE_URL}/users/by-name", json=initial_data)
-
-    if response1.status_code == 201:
-        user1 = response1.json()
-        print("✅ Initial user created successfully!")
-        print(f"   - ID: {user1['id']}")
-        print(f"   - Date of Birth: {user1['date_of_birth']}")
-    else:
-        print(
-            f"❌ Failed to create initial user: {response1.status_code} - {response1.text}"
-        )
-        return
-
-    # Updated user data with different date of birth
-    updated_data = {
-        "full_name": "Test Update User",  # Same name
-        "date_of_birth": "1995-06-15",  # Different DOB
-        "lifespan": 85,  # Different lifespan
-        "theme": "dark",  # Different theme
-        "font_size": 16,  # Different font size
-    }
+# The baseline user's GET by name URL
+BASELINE_USER_URL = f"{USERS_BY_NAME_URL}/{quote(INITIAL_DATA['full_name'], safe='')}"
 
-    print("\n2. Updating user with new data:")
-    print(f"   New DOB: {updated_data['date_of_birth']}")
-    print(f"   New Lifespan: {updated_data['lifespan']}")
-    print(f"   New Theme: {updated_data['theme']}")
-    print(f"   New Font Size: {updated_data['font_size']}")
+# Themes accepted by the API
+THEMES = ("light", "dark", "auto")
 
-    # Update user by calling the same endpoint with new data
-    response2 = requests.post(f"{BASE_URL}/users/by-name", json=updated_data)
-
-    if response2.status_code == 201:
-        user2 = response2.json()
-        print("✅ User update call completed!")
-        print(f"   - ID: {user2['id']}")
-        print(f"   - Date of Birth: {user2['date_of_birth']}")
-        print(f"   - Lifespan: {user2['lifespan']}")
-        print(f"   - Theme: {user2['theme']}")
-        print(f"   - Font Size: {user2['font_size']}")
-
-        # Verify it's the same user ID
-        if user1["id"] == user2["id"]:
-            print("✅ Same user ID - update attempted!")
-
-            # Check if date of birth was updated
-            if user2["date_of_birth"] == updated_data["date_of_birth"]:
-                print("✅ Date of birth was successfully updated!")
-            else:
-                print("❌ Date of birth was NOT updated!")
-                print(f"   Expected: {updated_data['date_of_birth']}")
-                print(f"   Got: {user2['date_of_birth']}")
-
-            # Check other fields
-            if user2["lifespan"] == updated_data["lifespan"]:
-                print("✅ Lifespan was successfully updated!")
-            else:
-                print(
-                    f"❌ Lifespan was NOT updated! Expected: {updated_data['lifespan']}, Got: {user2['lifespan']}"
-                )
-
-            if user2["theme"] == updated_data["theme"]:
-                print("✅ Theme was successfully updated!")
-            else:
-                print(
-                    f"❌ Theme was NOT updated! Expected: {updated_data['theme']}, Got: {user2['theme']}"
-                )
-
-            if user2["font_size"] == updated_data["font_size"]:
-                print("✅ Font size was successfully updated!")
-            else:
-                print(
-                    f"❌ Font size was NOT updated! Expected: {updated_data['font_size']}, Got: {user2['font_size']}"
-                )
-
-        else:
-            print("❌ Different user ID returned - should be the same user!")
-
-    else:
-        print(f"❌ Failed to update user: {response2.status_code} - {response2.text}")
-
-    print("\n🎉 Date of birth update test completed!")
-
-
-if __name__ == "__main__":
+
+@pytest.fixture(scope="session")
+def api_session(live_server):
+    """Provide one pooled keep-alive client per test process (xdist worker)."""
+    # Every request body is JSON, so set the header once for the client
+    with httpx.Client(
+        timeout=DEFAULT_TIMEOUT,
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+    ) as client:
+        yield client
+
+
+def _post_json(client, url, payload):
+    """POST a payload serialized with orjson through the JSON client."""
     try:
-        test_date_of_birth_update()
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to the API server.")
-        print(
-            "   Please make sure the backend server is running on http://127.0.0.1:8000"
-        )
-    except Exception as e:
-        print(f"❌ An error occurred: {e}")
+        return client.post(url, content=orjson.dumps(payload))
+    except httpx.TimeoutException as e:
+        pytest.fail(f"Backend too slow: POST {url} timed out ({e!r})")
+
+
+@pytest.fixture(scope="session")
+def baseline_user(api_session):
+    """Create (or reset) the "Test Update User" once per test process."""
+    response = _post_json(api_session, USERS_BY_NAME_URL, dict(INITIAL_DATA))
+    assert (
+        response.status_code == 201
+    ), f"Failed to create initial user: {response.status_code} - {response.text}"
+    return response.json()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "new_dob,lifespan,font_size",
+    [("1995-06-15", 85, 16), ("2000-12-31", 90, 18), ("1980-02-29", 75, 12)],
+)
+def test_date_of_birth_update(api_session, baseline_user, new_dob, lifespan, font_size):
+    """Test that date of birth gets updated when creating user with existing name."""
+
+    # Compare against the user's current state on the server rather than the
+    # baseline_user snapshot, since other cases may already have updated it
+    response1 = api_session.get(BASELINE_USER_URL)
+    assert (
+        response1.status_code == 200
+    ), f"Failed to fetch user: {response1.status_code} - {response1.text}"
+    user1 = response1.json()
+
+    # Same name with a new value for every other profile field; the theme has
+    # only three choices, so pick one the user does not have yet
+    updated_data = INITIAL_DATA | {
+        "date_of_birth": new_dob,
+        "lifespan": lifespan,
+        "theme": next(theme for theme in THEMES if theme != user1["theme"]),
+        "font_size": font_size,
+    }
+    unchanged = [key for key in UPDATED_FIELDS if user1[key] == updated_data[key]]
+    assert not unchanged, f"Update would not change {unchanged}"
+
+    # Update user by calling the same endpoint with new data
+    response2 = _post_json(api_session, USERS_BY_NAME_URL, updated_data)
+
+    assert (
+        response2.status_code == 201
+    ), f"Failed to update user: {response2.status_code} - {response2.text}"
+    user2 = response2.json()
+
+    # Verify it's the same user ID
+    assert (
+        baseline_user["id"] == user1["id"] == user2["id"]
+    ), "Different user returned - should be the same user!"
+
+    # Check that every profile field was updated
+    mismatches = {
+        key: {"expected": updated_data[key], "got": user2[key]}
+        for key in UPDATED_FIELDS
+        if user2[key] != updated_data[key]
+    }
+    assert not mismatches, f"Fields were NOT updated: {mismatches}"